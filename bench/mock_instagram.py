@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""Local stand-in for the bits of Instagram the scraper touches.
+
+Serves a login form, the account's profile with followers/following dialogs that
+load rows page by page as they're scrolled (with working Following buttons on the
+following rows), and other users' profiles with a working Following -> Unfollow
+flow. List sizes, render latency and failure rates
+are configurable so the scraper can be tested and benchmarked without the real site.
+
+    python bench/mock_instagram.py --followers 5000 --following 6000 --latency-ms 80
+    INSTA_BASE_URL=http://127.0.0.1:8000 python "Insta Unfollower.py" --dev
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Rows per dialog page, roughly what Instagram hands out per request
+PAGE_SIZE = 12
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 0; }}
+header {{ padding: 20px; }}
+div[role=dialog] {{ position: fixed; top: 10%; left: 30%; width: 400px; background: #fff; border: 1px solid #ccc; }}
+.row {{ height: 56px; display: flex; align-items: center; gap: 8px; }}
+</style></head>
+<body>{body}</body></html>
+"""
+
+LOGIN_BODY = """<main><form method="post" action="/accounts/login/">
+{error}
+<input name="username" type="text" aria-label="Phone number, username, or email" autocomplete="username">
+<input name="password" type="password" aria-label="Password" autocomplete="current-password">
+<button type="submit">Log in</button>
+</form></main>"""
+
+OWNER_BODY = """<header>
+<h2>{owner}</h2>
+<ul>
+<li><a href="/{owner}/followers/" class="list-link" data-kind="followers"><span title="{followers}">{followers_label}</span> followers</a></li>
+<li><a href="/{owner}/following/" class="list-link" data-kind="following"><span title="{following}">{following_label}</span> following</a></li>
+</ul>
+</header>
+<script>
+const OWNER = {owner_json};
+async function openList(kind) {{
+    const dialog = document.createElement('div');
+    dialog.setAttribute('role', 'dialog');
+    dialog.innerHTML = '<div><h1>' + kind + '</h1><button aria-label="Close">X</button></div>'
+        + '<div class="list" style="height: 400px; overflow-y: auto;"></div>';
+    document.body.appendChild(dialog);
+    const list = dialog.querySelector('.list');
+    let next = 0;
+    let loading = false;
+    async function loadMore() {{
+        if (loading || next === null) return;
+        loading = true;
+        const response = await fetch('/api/v1/friendships/' + OWNER + '/' + kind + '/?count={page_size}&max_id=' + next);
+        const data = await response.json();
+        for (const user of data.users) {{
+            const row = document.createElement('div');
+            row.className = 'row';
+            row.innerHTML = '<a href="/' + user.username + '/"><img alt=""></a>'
+                + '<a href="/' + user.username + '/"><span>' + user.username + '</span></a>'
+                + (user.is_verified ? '<span title="Verified">V</span>' : '')
+                + '<span>' + user.full_name + '</span>'
+                + '<button>' + (kind === 'following' ? 'Following' : 'Remove') + '</button>';
+            list.appendChild(row);
+        }}
+        next = data.next_max_id;
+        loading = false;
+        if (next !== null && list.scrollHeight <= list.clientHeight) loadMore();
+    }}
+    list.addEventListener('scroll', () => {{
+        if (list.scrollTop + list.clientHeight >= list.scrollHeight - 100) loadMore();
+    }});
+    dialog.querySelector('[aria-label=Close]').addEventListener('click', () => dialog.remove());
+    list.addEventListener('click', (event) => {{
+        const button = event.target.closest('button');
+        if (!button || button.textContent !== 'Following') return;
+        const username = button.closest('.row').querySelector('a').getAttribute('href').split('/')[1];
+        const confirm = document.createElement('div');
+        confirm.setAttribute('role', 'dialog');
+        confirm.innerHTML = '<p>Unfollow @' + username + '?</p>'
+            + '<button data-action="unfollow">Unfollow</button><button data-action="cancel">Cancel</button>';
+        confirm.querySelector('[data-action=cancel]').addEventListener('click', () => confirm.remove());
+        confirm.querySelector('[data-action=unfollow]').addEventListener('click', async () => {{
+            confirm.remove();
+            const response = await fetch('/api/unfollow/' + username + '/', {{method: 'POST'}});
+            if (response.status === 429) {{
+                const block = document.createElement('div');
+                block.setAttribute('role', 'dialog');
+                block.innerHTML = '<h3>Try Again Later</h3><p>We restrict certain activity to protect our community.</p>';
+                document.body.appendChild(block);
+            }} else {{
+                button.textContent = 'Follow';
+            }}
+        }});
+        document.body.appendChild(confirm);
+    }});
+    loadMore();
+}}
+for (const link of document.querySelectorAll('.list-link')) {{
+    link.addEventListener('click', (event) => {{ event.preventDefault(); openList(link.dataset.kind); }});
+}}
+</script>"""
+
+PROFILE_BODY = """<header>
+<h2>{username}</h2>
+{verified}
+<button id="follow-btn">{button}</button>
+</header>
+<main>{private}</main>
+<script>
+const USERNAME = {username_json};
+const followButton = document.getElementById('follow-btn');
+document.addEventListener('click', async (event) => {{
+    const button = event.target.closest('button');
+    if (!button) return;
+    if (button === followButton && followButton.textContent === 'Following') {{
+        const dialog = document.createElement('div');
+        dialog.setAttribute('role', 'dialog');
+        dialog.innerHTML = '<p>Unfollow @' + USERNAME + '?</p>'
+            + '<button data-action="unfollow">Unfollow</button><button data-action="cancel">Cancel</button>';
+        document.body.appendChild(dialog);
+    }} else if (button.dataset.action === 'unfollow') {{
+        button.closest('[role=dialog]').remove();
+        const response = await fetch('/api/unfollow/' + USERNAME + '/', {{method: 'POST'}});
+        if (response.status === 429) {{
+            const block = document.createElement('div');
+            block.setAttribute('role', 'dialog');
+            block.innerHTML = '<h3>Try Again Later</h3><p>We restrict certain activity to protect our community.</p>';
+            document.body.appendChild(block);
+        }} else {{
+            followButton.textContent = 'Follow';
+        }}
+    }} else if (button.dataset.action === 'cancel') {{
+        button.closest('[role=dialog]').remove();
+    }}
+}});
+</script>"""
+
+NOT_FOUND_BODY = """<main><h2>Sorry, this page isn't available.</h2><p>Page Not Found</p></main>"""
+
+ERROR_BODY = """<main><h2>Something went wrong</h2></main>"""
+
+
+class MockInstagram:
+    """In-memory account state plus the HTTP server that renders it"""
+
+    def __init__(self, followers=1000, following=1200, latency_ms=50, failure_rate=0.0,
+                 block_rate=0.0, gone_rate=0.0, owner='benchuser', seed=1):
+        self.owner = owner
+        self.latency = latency_ms / 1000.0
+        self.failure_rate = failure_rate
+        self.block_rate = block_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        # Half the following list follows back, the other half are the non-followers
+        self.following = [f"user{i:06d}" for i in range(following)]
+        start = following // 2
+        self.followers = [f"user{i:06d}" for i in range(start, start + followers)]
+        self.gone = {username for username in self.following if self._fraction(username) < gone_rate}
+        # Unfollowed accounts are tombstoned rather than removed so list pagination offsets stay stable
+        self.unfollowed = set()
+        self.unfollow_requests = 0
+        self.server = None
+        self.thread = None
+
+    def _fraction(self, username):
+        """Stable pseudo-random number in [0, 1) per username"""
+        return int(hashlib.md5(username.encode()).hexdigest()[:8], 16) / 0x100000000
+
+    def _user_payload(self, username):
+        return {
+            'pk': str(int(hashlib.md5(username.encode()).hexdigest()[:12], 16)),
+            'username': username,
+            'full_name': username.replace('user', 'User '),
+            'is_private': self._fraction(username) < 0.3,
+            'is_verified': self._fraction(username) > 0.97,
+        }
+
+    def delay(self):
+        if self.latency > 0:
+            time.sleep(self.latency * self.random.uniform(0.5, 1.5))
+
+    def roll(self, rate):
+        with self.lock:
+            return self.random.random() < rate
+
+    def start(self, host='127.0.0.1', port=0):
+        """Serve in a background thread and return the base URL"""
+        mock = self
+
+        class Handler(MockHandler):
+            state = mock
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name='mock-instagram', daemon=True)
+        self.thread.start()
+        return f"http://{host}:{self.server.server_address[1]}"
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+def format_count(count):
+    """Abbreviate like Instagram does (12.5K), the exact number goes in the title attribute"""
+    if count >= 10000:
+        return f"{count / 1000:.1f}K"
+    return f"{count:,}"
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _page(self, title, body, status=200):
+        self._send(status, PAGE_TEMPLATE.format(title=html.escape(title), body=body))
+
+    def _redirect(self, location, headers=None):
+        self.send_response(302)
+        self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _logged_in(self):
+        return 'sessionid=' in self.headers.get('Cookie', '')
+
+    def do_GET(self):
+        state = self.state
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split('/') if part]
+
+        if url.path == '/robots.txt':
+            return self._send(200, "User-agent: *\nDisallow: /\n", 'text/plain')
+        if url.path == '/accounts/login/':
+            state.delay()
+            return self._page('Login • Instagram', LOGIN_BODY.format(error=''))
+        if url.path == '/accounts/edit/':
+            if not self._logged_in():
+                return self._redirect('/accounts/login/')
+            return self._page('Edit profile • Instagram', '<main><h2>Edit profile</h2></main>')
+        if not parts:
+            return self._page('Instagram', '<main><h2>Home</h2></main>')
+
+        if parts[:2] == ['api', 'v1'] and len(parts) >= 5 and parts[2] == 'friendships':
+            return self._friendships(parts[4], parse_qs(url.query))
+
+        if len(parts) in (1, 2):
+            return self._profile(parts[0])
+
+        return self._page('Page Not Found • Instagram', NOT_FOUND_BODY, 404)
+
+    def do_POST(self):
+        state = self.state
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        length = int(self.headers.get('Content-Length') or 0)
+        form = parse_qs(self.rfile.read(length).decode('utf-8')) if length else {}
+
+        if url.path == '/accounts/login/':
+            state.delay()
+            username = form.get('username', [''])[0]
+            password = form.get('password', [''])[0]
+            if not username or password == 'wrong':
+                error = '<div id="slfErrorAlert" role="alert">Sorry, your password was incorrect.</div>'
+                return self._page('Login • Instagram', LOGIN_BODY.format(error=error))
+            state.owner = username
+            return self._redirect('/', {'Set-Cookie': f"sessionid=mock-{username}; Path=/"})
+
+        if len(parts) == 3 and parts[:2] == ['api', 'unfollow']:
+            state.delay()
+            username = parts[2]
+            if state.roll(state.block_rate):
+                return self._send(429, json.dumps({'status': 'fail', 'message': 'Please wait a few minutes'}), 'application/json')
+            with state.lock:
+                state.unfollow_requests += 1
+                state.unfollowed.add(username)
+            return self._send(200, json.dumps({'status': 'ok'}), 'application/json')
+
+        return self._send(404, json.dumps({'status': 'fail'}), 'application/json')
+
+    def _friendships(self, kind, query):
+        state = self.state
+        state.delay()
+        users = state.followers if kind == 'followers' else state.following
+        offset = int(query.get('max_id', ['0'])[0] or 0)
+        count = int(query.get('count', [str(PAGE_SIZE)])[0])
+        with state.lock:
+            page = [username for username in users[offset:offset + count] if username not in state.unfollowed]
+            next_offset = offset + count if offset + count < len(users) else None
+        payload = {
+            'users': [state._user_payload(username) for username in page],
+            'next_max_id': next_offset,
+            'big_list': len(users) > count,
+            'status': 'ok',
+        }
+        return self._send(200, json.dumps(payload), 'application/json')
+
+    def _profile(self, username):
+        state = self.state
+        state.delay()
+        if state.roll(state.failure_rate):
+            return self._page('Error • Instagram', ERROR_BODY, 500)
+        if username in state.gone:
+            return self._page('Page Not Found • Instagram', NOT_FOUND_BODY, 404)
+
+        if username == state.owner:
+            body = OWNER_BODY.format(
+                owner=html.escape(username), owner_json=json.dumps(username), page_size=PAGE_SIZE,
+                followers=len(state.followers), followers_label=format_count(len(state.followers)),
+                following=len(state.following) - len(state.unfollowed),
+                following_label=format_count(len(state.following) - len(state.unfollowed)),
+            )
+            return self._page(f"@{username} • Instagram", body)
+
+        payload = state._user_payload(username)
+        body = PROFILE_BODY.format(
+            username=html.escape(username), username_json=json.dumps(username),
+            button='Following' if username in state.following and username not in state.unfollowed else 'Follow',
+            verified='<span title="Verified">V</span>' if payload['is_verified'] else '',
+            private='<h2>This Account is Private</h2>' if payload['is_private'] else '<h2>Posts</h2>',
+        )
+        return self._page(f"@{username} • Instagram", body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a local Instagram stand-in for testing and benchmarks')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--followers', type=int, default=1000, help='Rows in the followers dialog')
+    parser.add_argument('--following', type=int, default=1200, help='Rows in the following dialog')
+    parser.add_argument('--latency-ms', type=float, default=50, help='Average render latency per page/API call')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Share of profile loads that error out')
+    parser.add_argument('--block-rate', type=float, default=0.0, help='Share of unfollows answered with an action block')
+    parser.add_argument('--gone-rate', type=float, default=0.0, help='Share of followed accounts that no longer exist')
+    args = parser.parse_args()
+
+    mock = MockInstagram(args.followers, args.following, args.latency_ms, args.failure_rate,
+                         args.block_rate, args.gone_rate)
+    base_url = mock.start(port=args.port)
+    print(f"🎭 Mock Instagram serving at {base_url} (Ctrl+C to stop)")
+    print(f"   Run the app against it with: INSTA_BASE_URL={base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    main()
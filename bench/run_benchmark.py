@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark of InstagramScraper against the local mock Instagram.
+
+Drives _perform_login, _scrape_followers_following and _perform_unfollow on the
+calling thread and reports wall time, rows/sec, per-step latency percentiles and
+peak memory. Needs the engine's requirements (selenium, Chrome) - not PyQt5.
+
+    python bench/run_benchmark.py --followers 20000 --following 22000 --unfollow 25 --json bench.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from mock_instagram import MockInstagram
+
+
+def load_app(base_url):
+    """Import the engine pointed at the mock (it reads the base URL at import time)"""
+    os.environ['INSTA_BASE_URL'] = base_url
+    sys.path.insert(0, ROOT)
+    return importlib.import_module('insta_engine')
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def self_peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def browser_rss_mb(driver):
+    """Current RSS of chromedriver plus every Chrome process under it"""
+    if psutil is None or driver is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(process.memory_info().rss for process in processes) / (1024 * 1024)
+    except (psutil.Error, AttributeError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the scraper end to end against a local mock Instagram')
+    parser.add_argument('--followers', type=int, default=2000)
+    parser.add_argument('--following', type=int, default=2400)
+    parser.add_argument('--latency-ms', type=float, default=50, help='Mock render latency per page/API call')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Share of profile loads that error out')
+    parser.add_argument('--block-rate', type=float, default=0.0, help='Share of unfollows answered with an action block')
+    parser.add_argument('--gone-rate', type=float, default=0.01, help='Share of followed accounts that no longer exist')
+    parser.add_argument('--unfollow', type=int, default=20, help='Non-followers to unfollow (0 skips the phase)')
+    parser.add_argument('--workers', type=int, default=1, help='Parallel unfollow sessions')
+    parser.add_argument('--unfollow-mode', choices=('profile', 'dialog'), default='profile',
+                        help='Unfollow on each profile page or from the following list rows')
+    parser.add_argument('--extraction', choices=('network', 'dom'), default='network',
+                        help='Read list rows from the page\'s JSON responses or from the DOM')
+    parser.add_argument('--browse-profile', choices=('lean', 'full'), default='lean',
+                        help='Skip media and don\'t wait for it, or load pages like normal Chrome')
+    parser.add_argument('--page-load-strategy', choices=('normal', 'eager', 'none'),
+                        help='Override the browsing profile\'s page load strategy')
+    parser.add_argument('--dev', action='store_true', help='Show the browser window')
+    parser.add_argument('--verbose', action='store_true', help='Print the scraper log')
+    parser.add_argument('--json', help='Also write the report to this file')
+    parser.add_argument('--trace', help='Also write every step as Chrome trace-event JSON to this file')
+    args = parser.parse_args()
+
+    mock = MockInstagram(args.followers, args.following, args.latency_ms, args.failure_rate,
+                         args.block_rate, args.gone_rate)
+    base_url = mock.start()
+    app = load_app(base_url)
+
+    json_path = os.path.abspath(args.json) if args.json else None
+    trace_path = os.path.abspath(args.trace) if args.trace else None
+    app.TRACER.enabled = bool(trace_path)
+
+    # Keep sessions, snapshots and journals out of the working tree
+    workdir = tempfile.mkdtemp(prefix='instaunfollower-bench-')
+    os.chdir(workdir)
+
+    # Pacing is for the real site - the mock gets hit as fast as the browser can go
+    scraper = app.InstagramScraper(dev_mode=args.dev, unfollow_workers=args.workers, actions_per_minute=6000,
+                                   hourly_budget=10 ** 6, daily_budget=10 ** 6)
+    scraper.username = mock.owner
+    scraper.password = 'benchmark'
+    scraper.unfollow_interval = (0, 0)
+    scraper.pyautogui_fallback = False
+    scraper.extraction_mode = args.extraction
+    scraper.unfollow_mode = args.unfollow_mode
+    scraper.browse_profile = args.browse_profile
+    scraper.page_load_strategy = args.page_load_strategy
+
+    results = {}
+    scraper.login_result.connect(lambda ok, message: results.update(login=ok))
+    scraper.scraping_complete.connect(lambda users: results.update(non_followers=users))
+    scraper.unfollow_complete.connect(lambda message: results.update(unfollow=message))
+
+    report = {
+        'config': vars(args),
+        'phases': {},
+        'steps': {},
+        'pages': {},
+    }
+    browser_peak = 0.0
+
+    def phase(name, func, rows=None):
+        nonlocal browser_peak
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        report['phases'][name] = {'seconds': round(elapsed, 3)}
+        if rows is not None:
+            count = rows()
+            report['phases'][name]['rows'] = count
+            report['phases'][name]['rows_per_sec'] = round(count / elapsed, 1) if elapsed else None
+        browser_peak = max(browser_peak, browser_rss_mb(scraper.driver) or 0.0)
+        for _, level, message in scraper.log_pipeline.drain():
+            if args.verbose:
+                print(f"  {message}")
+
+    total_started = time.perf_counter()
+    try:
+        phase('login', scraper._perform_login)
+        if not results.get('login'):
+            print("❌ Login against the mock failed - see --verbose")
+            return 1
+        phase('scrape', scraper._scrape_followers_following, rows=lambda: len(scraper.followers) + len(scraper.following))
+        if args.unfollow:
+            scraper.users_to_unfollow = results.get('non_followers', [])[:args.unfollow]
+            phase('unfollow', scraper._perform_unfollow, rows=lambda: mock.unfollow_requests)
+    finally:
+        if scraper.driver:
+            scraper._record_page(scraper.driver)
+        scraper.cleanup()
+        app.DRIVER_POOL.shutdown()
+        scraper.log_pipeline.close()
+        mock.stop()
+    report['phases']['total'] = {'seconds': round(time.perf_counter() - total_started, 3)}
+
+    for step, stats in sorted(scraper.step_stats.items()):
+        samples = stats['samples']
+        report['steps'][step] = {
+            'count': len(samples),
+            'p50': round(percentile(samples, 50), 3),
+            'p90': round(percentile(samples, 90), 3),
+            'p99': round(percentile(samples, 99), 3),
+            'max': round(max(samples), 3),
+        }
+    for page, stats in sorted(scraper.page_stats.items()):
+        report['pages'][page] = {
+            'count': stats['count'],
+            'avg_kb': round(stats['bytes'] / stats['count'] / 1024, 1),
+            'avg_dom_ready': round(stats['dom_ready'] / stats['count'], 3),
+            'avg_get_blocked': round(stats['blocked'] / stats['count'], 3),
+        }
+    report['memory'] = {
+        'python_peak_rss_mb': self_peak_rss_mb(),
+        'browser_peak_rss_mb': round(browser_peak, 1) if psutil else None,
+    }
+
+    print(f"\n📊 Benchmark: {args.followers} followers / {args.following} following, {args.latency_ms:.0f}ms latency")
+    for name, stats in report['phases'].items():
+        rate = f"  {stats['rows']} rows, {stats['rows_per_sec']} rows/s" if 'rows' in stats else ''
+        print(f"  {name:<10} {stats['seconds']:>9.2f}s{rate}")
+    print("\n  step                        count     p50     p90     p99     max")
+    for step, stats in report['steps'].items():
+        print(f"  {step:<26} {stats['count']:>6} {stats['p50']:>7.3f} {stats['p90']:>7.3f} {stats['p99']:>7.3f} {stats['max']:>7.3f}")
+    if report['pages']:
+        print("\n  page                        count  avg KB  DOM ready  get() blocked")
+        for page, stats in report['pages'].items():
+            print(f"  {page:<26} {stats['count']:>6} {stats['avg_kb']:>7.1f} {stats['avg_dom_ready']:>10.3f} {stats['avg_get_blocked']:>14.3f}")
+    memory = report['memory']
+    print(f"\n  peak RSS: python {memory['python_peak_rss_mb'] or 0:.1f} MB"
+          + (f", browser {memory['browser_peak_rss_mb']:.1f} MB (sampled at phase ends)" if memory['browser_peak_rss_mb'] else ''))
+
+    if trace_path:
+        print(f"\n  trace: {app.TRACER.export_chrome_trace(trace_path)} spans in {trace_path}")
+
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
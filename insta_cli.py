@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""Headless command line front end - scrape, diff and unfollow from a shell or cron, no Qt or display needed
+
+    python insta_cli.py scrape --username me --json > non_followers.json
+    python insta_cli.py diff --username me
+    python insta_cli.py unfollow --username me --from-file non_followers.txt --resume
+
+The password is read from an environment variable (INSTA_PASSWORD by default), never from the
+command line; a saved session is used first, so after one login cron runs need no password at all.
+JSON results go to stdout, the log to stderr. Exit codes: 0 done, 1 failed, 75 stopped early
+(pacing budget or action block - rerun with --resume), 130 interrupted.
+"""
+
+import sys
+import os
+import argparse
+import json
+import threading
+import time
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_RESUME_LATER = 75  # EX_TEMPFAIL
+EXIT_INTERRUPTED = 130
+
+
+class HeadlessRunner:
+    """Runs scraper tasks one at a time on the engine's worker thread and waits for each to settle"""
+
+    def __init__(self, engine, args):
+        self.engine = engine
+        self.quiet = args.quiet
+        self.log_pipeline = engine.LogPipeline()
+        self.scraper = engine.InstagramScraper(args.dev, self.log_pipeline, max(1, args.workers),
+                                               args.actions_per_minute, max(1, args.per_hour), max(1, args.per_day))
+        self.scraper.username = args.username
+        self.scraper.unfollow_mode = args.unfollow_mode
+        self.scraper.browse_profile = args.browse_profile
+        self.scraper.page_load_strategy = args.page_load_strategy
+        # No display to click on under cron
+        self.scraper.pyautogui_fallback = False
+        self.scraper.stale_after_days = getattr(args, 'stale_days', self.scraper.stale_after_days)
+        self.results = {}
+        self.done = threading.Event()
+        self.outcome = None
+        self.scraper.login_result.connect(lambda ok, message: self.results.update(login=(ok, message)))
+        self.scraper.scraping_complete.connect(lambda users: self.results.update(non_followers=users))
+        self.scraper.unfollow_complete.connect(lambda message: self.results.update(unfollow=message))
+        self.scraper.task_finished.connect(lambda kind: self._settle('finished'))
+        self.scraper.task_cancelled.connect(lambda kind: self._settle('cancelled'))
+        self.scraper.task_failed.connect(lambda kind, error: self.results.update(error=error))
+
+    def _settle(self, outcome):
+        self.outcome = outcome
+        self.done.set()
+
+    def run(self, task):
+        """Block until the task finishes, streaming the log to stderr; returns 'finished' or 'cancelled'"""
+        try:
+            while not self.done.wait(0.2):
+                self.flush_log()
+        except KeyboardInterrupt:
+            print("✋ Interrupted - stopping after the current step...", file=sys.stderr)
+            task.cancel()
+            self.done.wait(30)
+            self.flush_log()
+            raise
+        self.done.clear()
+        self.flush_log()
+        return self.outcome
+
+    def login(self, password_env):
+        self.scraper.password = os.environ.get(password_env, '')
+        self.run(self.scraper.login(self.scraper.username, self.scraper.password))
+        ok, message = self.results.get('login', (False, self.results.get('error', 'Login failed')))
+        if not ok:
+            print(f"❌ {message}", file=sys.stderr)
+        return ok
+
+    def flush_log(self):
+        for created, level, message in self.log_pipeline.drain():
+            if not self.quiet or level >= self.engine.WARNING:
+                print(f"[{time.strftime('%H:%M:%S', time.localtime(created))}] {message}", file=sys.stderr)
+
+    def close(self):
+        self.scraper.shutdown()
+        self.scraper.cleanup()
+        self.engine.DRIVER_POOL.shutdown()
+        self.flush_log()
+        self.log_pipeline.close()
+
+
+def emit(payload):
+    json.dump(payload, sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write('\n')
+
+
+def read_usernames(path):
+    """One username per line, '@' and '#' comments allowed; '-' reads stdin"""
+    handle = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        usernames, seen = [], set()
+        for line in handle:
+            username = line.split('#', 1)[0].strip().lstrip('@')
+            if username and username not in seen:
+                seen.add(username)
+                usernames.append(username)
+        return usernames
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def cmd_scrape(engine, args):
+    runner = HeadlessRunner(engine, args)
+    try:
+        if not runner.login(args.password_env):
+            return EXIT_FAILED
+        if runner.run(runner.scraper.scrape_data()) != 'finished':
+            return EXIT_FAILED
+        # A failed scrape still ends with an empty list - don't pass that off as "everyone follows back"
+        if 'error' in runner.results:
+            print(f"❌ Scrape failed: {runner.results['error']}", file=sys.stderr)
+            return EXIT_FAILED
+        non_followers = runner.results.get('non_followers', [])
+        scraper = runner.scraper
+        if args.json:
+            analysis = scraper.analysis or {'followed_days': {}, 'mutuals': None, 'stale': [], 'lost_followers': []}
+            emit({
+                'account': scraper.username,
+                'followers': len(scraper.followers),
+                'following': len(scraper.following),
+                'mutuals': analysis['mutuals'],
+                'non_followers': [dict(scraper.profiles.get(username, {}), username=username,
+                                       followed_days=analysis['followed_days'].get(username))
+                                  for username in non_followers],
+                'stale': analysis['stale'],
+                'lost_followers': analysis['lost_followers'],
+            })
+        else:
+            for username in non_followers:
+                print(username)
+        return EXIT_OK
+    finally:
+        runner.close()
+
+
+def cmd_diff(engine, args):
+    """Compare the last two stored snapshots of each list - reads the database only, no browser"""
+    store = engine.SnapshotStore()
+    report = {'account': args.username}
+    for kind in ('followers', 'following'):
+        snapshots = store.snapshots(args.username, kind, limit=2)
+        if len(snapshots) < 2:
+            report[kind] = {'snapshots': len(snapshots), 'added': [], 'removed': []}
+            continue
+        new, old = snapshots
+        added, removed = store.diff(old['id'], new['id'])
+        report[kind] = {'from': old['taken_at'], 'to': new['taken_at'], 'size': new['size'],
+                        'added': added, 'removed': removed}
+    graph = engine.FollowGraph(store)
+    analysis = graph.report(args.username)
+    if analysis:
+        report['mutuals'] = analysis['mutuals']
+        report['non_followers'] = analysis['non_followers']
+        report['lost_followers'] = analysis['lost_followers']
+    if args.overlap:
+        report['overlap'] = [{'username': username, 'accounts': count}
+                             for username, count in graph.overlap([args.username] + args.overlap)]
+    if args.json:
+        emit(report)
+    else:
+        for kind in ('followers', 'following'):
+            for username in report[kind]['added']:
+                print(f"+{kind} {username}")
+            for username in report[kind]['removed']:
+                print(f"-{kind} {username}")
+        for shared in report.get('overlap', []):
+            print(f"={shared['accounts']} {shared['username']}")
+    return EXIT_OK
+
+
+def cmd_unfollow(engine, args):
+    usernames = read_usernames(args.from_file)
+    if not usernames:
+        print("❌ No usernames to unfollow", file=sys.stderr)
+        return EXIT_FAILED
+    runner = HeadlessRunner(engine, args)
+    try:
+        if not runner.login(args.password_env):
+            return EXIT_FAILED
+        outcome = runner.run(runner.scraper.unfollow_users(usernames, resume=args.resume))
+        job = engine.UnfollowJournal(args.username).last_job() or {'job': None, 'finished': False, 'states': {}}
+        if args.json:
+            emit({
+                'account': args.username,
+                'job': job['job'],
+                'finished': job['finished'],
+                'message': runner.results.get('unfollow', ''),
+                'states': {user: {'state': state, 'reason': reason} for user, (state, reason) in job['states'].items()},
+            })
+        else:
+            print(runner.results.get('unfollow', ''))
+        if outcome != 'finished' or 'error' in runner.results:
+            return EXIT_FAILED
+        return EXIT_OK if job['finished'] else EXIT_RESUME_LATER
+    finally:
+        runner.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Instagram Ghost Detector - headless mode')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only log warnings and errors to stderr')
+    parser.add_argument('--trace', metavar='FILE', help='Write per-step timings as Chrome trace-event JSON to FILE')
+    parser.add_argument('--metrics-port', type=int, help='Serve Prometheus metrics on http://127.0.0.1:PORT/metrics while running')
+    parser.add_argument('--metrics-file', help='Dump the metrics to this file (node_exporter textfile format), also on exit')
+    parser.add_argument('--metrics-interval', type=float, default=15, help='Seconds between metrics file dumps')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_account(command):
+        command.add_argument('--username', required=True, help='Instagram account to work on')
+        command.add_argument('--json', action='store_true', help='Print the result as JSON on stdout')
+
+    def add_browser(command):
+        command.add_argument('--password-env', default='INSTA_PASSWORD',
+                             help='Environment variable holding the password (only needed without a saved session)')
+        command.add_argument('--dev', action='store_true', help='Show the browser window')
+        command.add_argument('--workers', type=int, default=1, help='Browser sessions to unfollow with in parallel')
+        command.add_argument('--actions-per-minute', type=float, default=6, help='Fastest unfollow pace, shared by all sessions')
+        command.add_argument('--per-hour', type=int, default=60, help='Unfollows allowed in any rolling hour')
+        command.add_argument('--per-day', type=int, default=200, help='Unfollows allowed in any rolling 24 hours')
+        command.add_argument('--unfollow-mode', choices=('profile', 'dialog'), default='profile',
+                             help='Unfollow on each profile page, or in place from the rows of the following list')
+        command.add_argument('--browse-profile', choices=('lean', 'full'), default='lean',
+                             help='lean skips images, video and fonts and doesn\'t wait for them; full loads pages like normal Chrome')
+        command.add_argument('--page-load-strategy', choices=('normal', 'eager', 'none'),
+                             help='Override how long page loads block (default: eager for lean, normal for full)')
+
+    scrape = commands.add_parser('scrape', help='Log in, harvest both lists and list who doesn\'t follow back')
+    add_account(scrape)
+    add_browser(scrape)
+    scrape.add_argument('--stale-days', type=int, default=30, help='Flag non-followers followed at least this long')
+    scrape.set_defaults(handler=cmd_scrape)
+
+    diff = commands.add_parser('diff', help='Show who came and went between the last two scrapes')
+    add_account(diff)
+    diff.add_argument('--overlap', nargs='+', default=[], metavar='ACCOUNT',
+                      help='Also list who more than one of these accounts (and --username) follows')
+    diff.set_defaults(handler=cmd_diff)
+
+    unfollow = commands.add_parser('unfollow', help='Unfollow the accounts listed in a file')
+    add_account(unfollow)
+    add_browser(unfollow)
+    unfollow.add_argument('--from-file', required=True, help='File with one username per line, - for stdin')
+    unfollow.add_argument('--resume', action='store_true', help='Skip accounts the interrupted job already confirmed')
+    unfollow.set_defaults(handler=cmd_unfollow)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Imported after parsing so --help stays instant
+    import insta_engine
+    insta_engine.TRACER.enabled = bool(args.trace)
+    if args.metrics_port is not None:
+        insta_engine.METRICS.serve(args.metrics_port)
+    if args.metrics_file:
+        insta_engine.METRICS.dump_every(args.metrics_file, args.metrics_interval)
+    try:
+        return args.handler(insta_engine, args)
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+    finally:
+        insta_engine.METRICS.close()
+        if args.trace:
+            count = insta_engine.TRACER.export_chrome_trace(args.trace)
+            print(f"⏱️ Wrote {count} spans to {args.trace}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
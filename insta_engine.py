@@ -0,0 +1,3395 @@
+#!/usr/bin/env python3
+"""Scraping and unfollow engine - browser automation, storage and pacing, no GUI toolkit needed"""
+
+import sys
+import os
+import base64
+import re
+import shutil
+import subprocess
+import time
+import random
+import statistics
+import sqlite3
+import logging
+import logging.handlers
+import queue
+import collections
+import bisect
+import itertools
+import json
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+# Suppress all deprecation warnings
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+os.environ["PYTHONWARNINGS"] = "ignore::DeprecationWarning"
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    import chromedriver_autoinstaller
+    SELENIUM_MISSING = None
+except ImportError as e:
+    # Only the browser tasks need these - the stores, snapshot diffs and reports work without them
+    SELENIUM_MISSING = str(e)
+    webdriver = Service = Options = WebDriverWait = EC = chromedriver_autoinstaller = None
+
+    class By:
+        NAME = "name"
+        TAG_NAME = "tag name"
+        XPATH = "xpath"
+        CSS_SELECTOR = "css selector"
+
+    class WebDriverException(Exception):
+        pass
+
+    class TimeoutException(WebDriverException):
+        pass
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Where the scraper points its browser - overridable so it can run against a local stand-in
+INSTAGRAM_URL = os.environ.get('INSTA_BASE_URL', 'https://www.instagram.com').rstrip('/')
+
+# Log severities, on the standard logging scale so the log file can use them directly
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+SUCCESS = 25
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+logging.addLevelName(SUCCESS, 'SUCCESS')
+
+LOG_COLORS = {
+    DEBUG: '#60a5fa',    # Info blue
+    INFO: '#e2e8f0',     # Default light
+    SUCCESS: '#22d3ee',  # Success cyan
+    WARNING: '#fbbf24',  # Warning amber
+    ERROR: '#f87171',    # Error red
+}
+
+# Lines kept in the logs tab, older ones are dropped from the view (not from the log file)
+MAX_LOG_LINES = 5000
+
+# Instagram paths that show up as links inside the dialogs but aren't usernames
+RESERVED_PATHS = {'explore', 'p', 'reel', 'reels', 'stories', 'accounts', 'direct', 'tv', 'about', 'legal'}
+
+# Give up once this many scrolls in a row render no new rows within the rows_loaded budget
+MAX_STALE_SCROLLS = 4
+
+# Dialogs list newest first, so this many already-known usernames in a row means the rest is unchanged
+KNOWN_RUN_TO_STOP = 30
+
+# Text Instagram shows when it's rate limiting or blocking actions on the account
+ACTION_BLOCK_PHRASES = ("Try Again Later", "Action Blocked", "We restrict certain activity", "Please wait a few minutes")
+
+# A following snapshot younger than this is trusted by the unfollow pre-check without reopening the list
+PRECHECK_MAX_AGE = 15 * 60
+
+# Longest the unfollow run waits in place for a slot - beyond that it stops and can be resumed later
+PACING_MAX_WAIT = 3600
+
+# Finds the element inside the dialog that actually scrolls (the list, not the dialog itself)
+FIND_SCROLL_BOX_JS = """
+const dialog = arguments[0];
+const boxes = [dialog, ...dialog.querySelectorAll('div')];
+for (const el of boxes) {
+    const style = window.getComputedStyle(el);
+    if ((style.overflowY === 'auto' || style.overflowY === 'scroll') && el.scrollHeight > el.clientHeight) {
+        return el;
+    }
+}
+return dialog;
+"""
+
+# Serializes every dialog row from index arguments[1] on in one call - username, display name,
+# verified badge and follow-state button label - instead of a WebDriver round trip per field
+EXTRACT_ROWS_JS = """
+const dialog = arguments[0];
+const start = arguments[1];
+const skip = new Set(arguments[2]);
+const anchors = dialog.querySelectorAll('a[href]');
+const rows = [];
+const seen = new Set();
+for (let i = start; i < anchors.length; i++) {
+    const parts = new URL(anchors[i].href, location.href).pathname.split('/').filter(Boolean);
+    if (parts.length !== 1 || skip.has(parts[0]) || seen.has(parts[0])) continue;
+    seen.add(parts[0]);
+    let row = anchors[i];
+    while (row.parentElement && row.parentElement !== dialog && !row.querySelector('button, [role=button]')) {
+        row = row.parentElement;
+    }
+    const button = row.querySelector('button, [role=button]');
+    const badge = row.querySelector('[aria-label=Verified], [title=Verified]');
+    const label = button ? button.innerText.trim() : '';
+    const ignore = new Set([parts[0], label, badge ? badge.innerText.trim() : '', '·', 'Verified']);
+    const names = row.innerText.split('\\n').map(line => line.trim()).filter(line => line && !ignore.has(line));
+    rows.push({username: parts[0], full_name: names[0] || '', verified: !!badge, button: label});
+}
+return {total: anchors.length, rows: rows};
+"""
+
+# Everything the unfollow flow needs to know about a profile page, in one call
+PROFILE_STATE_JS = """
+const phrases = arguments[0];
+const text = document.body ? document.body.innerText : '';
+const notices = Array.from(document.querySelectorAll('[role=dialog], h2')).map(el => el.innerText);
+const buttons = Array.from(document.querySelectorAll('button, [role=button]')).map(el => el.innerText.trim()).filter(Boolean);
+const header = document.querySelector('header') || document.body || document;
+const followers = header.querySelector('a[href$="/followers/"] span[title], a[href$="/followers/"] span');
+return {
+    gone: document.title.includes('Page Not Found') || text.includes('Page Not Found') || text.includes('User Not Found'),
+    private: text.includes('This Account is Private'),
+    blocked: notices.some(notice => phrases.some(phrase => notice.includes(phrase))),
+    buttons: buttons,
+    verified: !!header.querySelector('[aria-label="Verified"], [title="Verified"]'),
+    business: buttons.some(label => label === 'Contact' || label === 'Email'),
+    followers: followers ? (followers.getAttribute('title') || followers.innerText) : null
+};
+"""
+
+# The follow-state button on a username's row in the open list dialog
+ROW_BUTTON_JS = """
+const username = arguments[0];
+for (const anchor of document.querySelectorAll('[role=dialog] a[href]')) {
+    const parts = new URL(anchor.href, location.href).pathname.split('/').filter(Boolean);
+    if (parts.length !== 1 || parts[0] !== username) continue;
+    let row = anchor;
+    while (row.parentElement && !row.querySelector('button, [role=button]')) {
+        row = row.parentElement;
+    }
+    return row.querySelector('button, [role=button]');
+}
+return null;
+"""
+
+# Returns [index, element] for the first selector in arguments[0] with a (visible, enabled) match
+SELECTOR_RACE_JS = """
+const strategies = arguments[0];
+const clickable = arguments[1];
+const usable = el => !clickable || (el.getClientRects().length > 0 && !el.disabled);
+for (let i = 0; i < strategies.length; i++) {
+    const [kind, query] = strategies[i];
+    let matches = [];
+    try {
+        if (kind === 'css') {
+            matches = Array.from(document.querySelectorAll(query));
+        } else {
+            const result = document.evaluate(query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let j = 0; j < result.snapshotLength; j++) matches.push(result.snapshotItem(j));
+        }
+    } catch (e) {
+        continue;
+    }
+    const match = matches.find(usable);
+    if (match) return [i, match];
+}
+return null;
+"""
+
+# Per-step wait budgets: (timeout in seconds, fixed sleep the step used to take)
+STEP_BUDGETS = {
+    'login.session_check': (10, 15),  # replaces the whole form login (5s + 1s + 1s + 8s of sleeps)
+    'login.page_ready': (15, 5),
+    'login.username_typed': (3, 1),
+    'login.password_typed': (3, 1),
+    'login.submitted': (20, 8),
+    'scrape.profile_ready': (15, 3),
+    'scrape.dialog_open': (10, 3),
+    'scrape.rows_loaded': (3, 1),
+    'scrape.dialog_closed': (5, 2),
+    'unfollow.profile_ready': (15, 4),
+    'unfollow.confirm_dialog': (5, 2),
+    'unfollow.verified': (8, 2),
+    'page.commit': (10, 0),
+}
+
+# 'lean' skips everything the scraper never looks at, 'full' browses like a regular Chrome window
+BROWSE_PROFILES = {
+    'lean': {'page_load_strategy': 'eager', 'window_size': '1280,900', 'block_media': True},
+    'full': {'page_load_strategy': 'normal', 'window_size': '1920,1080', 'block_media': False},
+}
+
+# Media and fonts the lean profile refuses to download (Network.setBlockedURLs wildcards, query strings included)
+BLOCKED_URL_PATTERNS = [
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.heic*', '*.ico*', '*.svg*',
+    '*.mp4*', '*.m4s*', '*.m4a*', '*.webm*', '*.m3u8*',
+    '*.woff*', '*.ttf*', '*.otf*', '*.eot*',
+]
+
+# Identity, transfer size and timings of the current document. Cross-origin entries without
+# Timing-Allow-Origin report 0 bytes, so the total is a lower bound.
+PAGE_METRICS_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+let bytes = nav ? nav.transferSize : 0;
+for (const entry of performance.getEntriesByType('resource')) bytes += entry.transferSize || 0;
+return {
+    origin: performance.timeOrigin,
+    url: location.href,
+    bytes: bytes,
+    dom_ready: nav ? nav.domContentLoadedEventEnd : null,
+};
+"""
+
+# Installs a MutationObserver once per page and reports whether the DOM has been quiet for arguments[0] ms
+DOM_QUIET_JS = """
+if (!window.__iuMutationObserver) {
+    window.__iuLastMutation = Date.now();
+    window.__iuMutationObserver = new MutationObserver(() => { window.__iuLastMutation = Date.now(); });
+    window.__iuMutationObserver.observe(document, {childList: true, subtree: true, attributes: true});
+}
+return Date.now() - window.__iuLastMutation >= arguments[0];
+"""
+
+
+class dom_quiet:
+    """Wait condition: the page has stopped mutating for quiet_ms milliseconds"""
+
+    def __init__(self, quiet_ms=300):
+        self.quiet_ms = quiet_ms
+
+    def __call__(self, driver):
+        return driver.execute_script(DOM_QUIET_JS, self.quiet_ms)
+
+
+class document_ready:
+    """Wait condition: the document has been parsed and the locator is present"""
+
+    def __init__(self, locator):
+        self.locator = locator
+
+    def __call__(self, driver):
+        # 'interactive' is enough - under the eager/none load strategies 'complete' means nothing we need
+        if driver.execute_script("return document.readyState") == 'loading':
+            return False
+        elements = driver.find_elements(*self.locator)
+        return elements[0] if elements else False
+
+
+class element_count_above:
+    """Wait condition: more than `count` elements match the locator inside `parent`"""
+
+    def __init__(self, parent, locator, count):
+        self.parent = parent
+        self.locator = locator
+        self.count = count
+
+    def __call__(self, driver):
+        elements = self.parent.find_elements(*self.locator)
+        return elements if len(elements) > self.count else False
+
+
+class FriendshipFeed:
+    """Reads the followers/following JSON the page fetches for itself out of Chrome's performance log"""
+
+    URL_PATTERN = re.compile(r'/api/v1/friendships/[^/]+/(followers|following)/')
+
+    def __init__(self, driver, kind):
+        self.driver = driver
+        self.kind = kind
+        self.pending = set()
+        self.users = []
+        self.finished = False
+        try:
+            # Drop whatever was logged before the dialog opened
+            driver.get_log('performance')
+            self.available = True
+        except Exception:
+            self.available = False
+
+    def collect(self):
+        """Buffer users from responses that finished loading since the last call, True if there are any"""
+        if not self.available:
+            return False
+        try:
+            entries = self.driver.get_log('performance')
+        except WebDriverException:
+            self.available = False
+            return False
+
+        finished = []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            params = message.get('params', {})
+            if message.get('method') == 'Network.responseReceived':
+                response = params.get('response', {})
+                match = self.URL_PATTERN.search(response.get('url', ''))
+                if match and match.group(1) == self.kind and response.get('status') == 200:
+                    self.pending.add(params.get('requestId'))
+            elif message.get('method') == 'Network.loadingFinished' and params.get('requestId') in self.pending:
+                finished.append(params['requestId'])
+
+        for request_id in finished:
+            self.pending.discard(request_id)
+            try:
+                body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                text = base64.b64decode(body['body']).decode('utf-8') if body.get('base64Encoded') else body['body']
+                payload = json.loads(text)
+            except (WebDriverException, KeyError, ValueError):
+                continue
+            self.users.extend(payload.get('users', []))
+            if not payload.get('next_max_id'):
+                self.finished = True
+        return bool(self.users)
+
+    def take(self):
+        users, self.users = self.users, []
+        return users
+
+
+def format_duration(seconds):
+    """Render seconds as '45s', '12m 5s' or '3h 20m'"""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+
+
+class LogPipeline:
+    """Buffers log records from any thread for batched UI flushes and writes them to a rotating file"""
+
+    def __init__(self, path=os.path.join('logs', 'instaunfollower.log'), max_bytes=5 * 1024 * 1024, backups=3):
+        # deque append/popleft are atomic, so producers never block on the UI
+        self._buffer = collections.deque()
+        self.logger = logging.getLogger('instaunfollower')
+        self.logger.setLevel(DEBUG)
+        self.logger.propagate = False
+        self.listener = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding='utf-8')
+            file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)-7s %(message)s'))
+            # The listener thread does the file I/O, producers only enqueue
+            log_queue = queue.SimpleQueue()
+            self.logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+            self.listener = logging.handlers.QueueListener(log_queue, file_handler)
+            self.listener.start()
+        except OSError as e:
+            # stderr, not stdout - the CLI's --json output goes there
+            print(f"⚠️ Log file disabled: {e}", file=sys.stderr)
+
+    def log(self, message, level=INFO):
+        self._buffer.append((time.time(), level, message))
+        self.logger.log(level, message)
+
+    def drain(self):
+        """Take every buffered record, oldest first"""
+        records = []
+        while self._buffer:
+            records.append(self._buffer.popleft())
+        return records
+
+    def close(self):
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+
+
+class Span:
+    """One timed step: name, fields such as the username, and an outcome ('ok' unless set or raised)"""
+
+    __slots__ = ('tracer', 'name', 'fields', 'outcome', 'started', 'parent')
+
+    def __init__(self, tracer, name, fields):
+        self.tracer = tracer
+        self.name = name
+        self.fields = fields
+        self.outcome = None
+
+    def __enter__(self):
+        local = self.tracer.local
+        self.parent = getattr(local, 'span', None)
+        local.span = self
+        self.started = time.perf_counter_ns()
+        return self
+
+    def set(self, outcome=None, **fields):
+        if outcome is not None:
+            self.outcome = outcome
+        self.fields.update(fields)
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.outcome is None:
+            self.outcome = 'ok' if exc_type is None else exc_type.__name__
+        self.tracer._finish(self, time.perf_counter_ns())
+        self.tracer.local.span = self.parent
+        return False
+
+
+class NullSpan:
+    """What a disabled tracer hands out - one shared object, nothing recorded"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, outcome=None, **fields):
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    """Collects spans from every thread into a bounded buffer plus per-step latency histograms
+
+    Disabled, span() returns the shared NULL_SPAN, so instrumentation can stay in hot paths.
+    """
+
+    # Histogram bucket upper bounds in seconds, the last bucket catches everything slower
+    BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+    # Fields a span picks up from the open span around it on the same thread (waits inside a profile visit)
+    INHERITED = ('username',)
+
+    def __init__(self, enabled=False, max_spans=100000):
+        self.enabled = enabled
+        self.spans = collections.deque(maxlen=max_spans)
+        self.histograms = {}
+        self.threads = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.epoch = time.perf_counter_ns()
+
+    def span(self, name, **fields):
+        if not self.enabled:
+            return NULL_SPAN
+        parent = getattr(self.local, 'span', None)
+        if parent is not None:
+            for field in self.INHERITED:
+                if field in parent.fields:
+                    fields.setdefault(field, parent.fields[field])
+        return Span(self, name, fields)
+
+    def _finish(self, span, ended):
+        seconds = (ended - span.started) / 1e9
+        thread = threading.current_thread()
+        with self.lock:
+            self.spans.append((span.name, span.started, ended, thread.ident, span.outcome, span.fields))
+            self.threads[thread.ident] = thread.name
+            histogram = self.histograms.get(span.name)
+            if histogram is None:
+                histogram = self.histograms[span.name] = {
+                    'count': 0, 'total': 0.0, 'max': 0.0, 'buckets': [0] * (len(self.BUCKETS) + 1), 'outcomes': {}
+                }
+            histogram['count'] += 1
+            histogram['total'] += seconds
+            histogram['max'] = max(histogram['max'], seconds)
+            histogram['buckets'][bisect.bisect_left(self.BUCKETS, seconds)] += 1
+            histogram['outcomes'][span.outcome] = histogram['outcomes'].get(span.outcome, 0) + 1
+
+    def summary(self):
+        """Per-step {'count', 'mean', 'p50', 'p90', 'max', 'buckets', 'outcomes'}, percentiles at bucket resolution"""
+        with self.lock:
+            histograms = {name: dict(h, buckets=list(h['buckets']), outcomes=dict(h['outcomes']))
+                          for name, h in self.histograms.items()}
+        summary = {}
+        for name, histogram in sorted(histograms.items()):
+            summary[name] = {
+                'count': histogram['count'],
+                'mean': histogram['total'] / histogram['count'],
+                'p50': self._percentile(histogram, 0.5),
+                'p90': self._percentile(histogram, 0.9),
+                'max': histogram['max'],
+                'buckets': histogram['buckets'],
+                'outcomes': histogram['outcomes'],
+            }
+        return summary
+
+    def _percentile(self, histogram, fraction):
+        target = fraction * histogram['count']
+        seen = 0
+        for index, count in enumerate(histogram['buckets']):
+            seen += count
+            if seen >= target:
+                return min(self.BUCKETS[index], histogram['max']) if index < len(self.BUCKETS) else histogram['max']
+        return histogram['max']
+
+    def export_chrome_trace(self, path):
+        """Write the buffered spans as Chrome trace-event JSON (chrome://tracing, Perfetto), returns the span count"""
+        with self.lock:
+            spans = list(self.spans)
+            threads = dict(self.threads)
+        pid = os.getpid()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                  for tid, name in threads.items()]
+        for name, started, ended, tid, outcome, fields in spans:
+            events.append({
+                'name': name,
+                'cat': name.split('.', 1)[0],
+                'ph': 'X',
+                'ts': (started - self.epoch) / 1000.0,
+                'dur': (ended - started) / 1000.0,
+                'pid': pid,
+                'tid': tid,
+                'args': dict(fields, outcome=outcome),
+            })
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, default=str)
+        return len(spans)
+
+    def reset(self):
+        with self.lock:
+            self.spans.clear()
+            self.histograms = {}
+
+
+# Shared by every scraper and worker thread, off until --trace or the Performance tab turns it on
+TRACER = Tracer()
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms rendered in the Prometheus text format
+
+    Every thread writes into its own shard (a plain dict), so updates from the scraper and
+    worker threads never take a lock; render() sums the shards when something scrapes.
+    """
+
+    def __init__(self):
+        self.meta = {}
+        self.gauges = {}
+        self.callbacks = {}
+        self.shards = []
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.server = None
+        self.dump_thread = None
+        self.dump_stop = threading.Event()
+
+    def counter(self, name, help_text):
+        self.meta[name] = ('counter', help_text, None)
+
+    def gauge(self, name, help_text, callback=None):
+        """Declare a gauge, read from callback() at render time when one is given"""
+        self.meta[name] = ('gauge', help_text, None)
+        if callback is not None:
+            self.callbacks[name] = callback
+
+    def histogram(self, name, help_text, buckets):
+        self.meta[name] = ('histogram', help_text, tuple(buckets))
+
+    def _shard(self):
+        try:
+            return self.local.shard
+        except AttributeError:
+            shard = self.local.shard = {}
+            with self.lock:
+                self.shards.append(shard)
+            return shard
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        shard = self._shard()
+        shard[key] = shard.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        shard = self._shard()
+        series = shard.get(key)
+        buckets = self.meta[name][2]
+        if series is None:
+            series = shard[key] = [0] * (len(buckets) + 3)  # per-bucket counts, +Inf, sum, count
+        series[bisect.bisect_left(buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def _collect(self):
+        with self.lock:
+            shards = list(self.shards)
+        totals = {}
+        for shard in shards:
+            for key, value in list(shard.items()):
+                if isinstance(value, list):
+                    total = totals.setdefault(key, [0] * len(value))
+                    for index, part in enumerate(value):
+                        total[index] += part
+                else:
+                    totals[key] = totals.get(key, 0) + value
+        totals.update(self.gauges)
+        for name, callback in self.callbacks.items():
+            try:
+                totals[(name, ())] = callback()
+            except Exception:
+                continue
+        return totals
+
+    @staticmethod
+    def _labels(labels, extra=()):
+        pairs = list(labels) + list(extra)
+        if not pairs:
+            return ''
+        escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+        return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + '}'
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        series = collections.defaultdict(list)
+        for (name, labels), value in self._collect().items():
+            series[name].append((labels, value))
+        lines = []
+        for name, (kind, help_text, buckets) in sorted(self.meta.items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in sorted(series.get(name, []), key=lambda item: item[0]):
+                if kind != 'histogram':
+                    lines.append(f"{name}{self._labels(labels)} {value:g}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(buckets + ('+Inf',), value):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{self._labels(labels, [('le', f'{bound:g}' if bound != '+Inf' else bound)])} {cumulative}")
+                lines.append(f"{name}_sum{self._labels(labels)} {value[-2]:g}")
+                lines.append(f"{name}_count{self._labels(labels)} {value[-1]}")
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port, host='127.0.0.1'):
+        """Expose /metrics over HTTP from a daemon thread, returns the bound port"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+        return self.server.server_address[1]
+
+    def write_textfile(self, path):
+        """Atomically replace path with the current metrics (node_exporter textfile collector format)"""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+    def dump_every(self, path, interval=15):
+        """Rewrite the textfile every `interval` seconds until close()"""
+        def loop():
+            while not self.dump_stop.wait(interval):
+                try:
+                    self.write_textfile(path)
+                except OSError:
+                    continue
+            try:
+                self.write_textfile(path)
+            except OSError:
+                pass
+
+        self.dump_stop.clear()
+        self.dump_thread = threading.Thread(target=loop, name="metrics-textfile", daemon=True)
+        self.dump_thread.start()
+
+    def close(self):
+        """Stop serving and write the textfile one last time"""
+        self.dump_stop.set()
+        if self.dump_thread is not None:
+            self.dump_thread.join(5)
+            self.dump_thread = None
+        if self.server is not None:
+            self.server.shutdown()
+            self.server = None
+
+
+METRICS = MetricsRegistry()
+METRICS.counter('instaunfollower_unfollow_attempts_total', 'Unfollows attempted')
+METRICS.counter('instaunfollower_unfollows_total', 'Unfollow outcomes by status and reason')
+METRICS.histogram('instaunfollower_unfollow_seconds', 'Time to unfollow one account', (0.5, 1, 2, 5, 10, 20, 60))
+METRICS.counter('instaunfollower_page_loads_total', 'Pages navigated to, by page kind')
+METRICS.histogram('instaunfollower_page_load_seconds', 'How long get() blocked per page', (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30))
+METRICS.counter('instaunfollower_wait_timeouts_total', 'Wait steps that ran out of budget')
+METRICS.counter('instaunfollower_selector_misses_total', 'Selector races where no strategy matched')
+METRICS.counter('instaunfollower_rows_scraped_total', 'List rows harvested, by list kind')
+METRICS.gauge('instaunfollower_scrape_rows_per_second', 'Harvest rate of the last scrape of each list')
+METRICS.counter('instaunfollower_browsers_launched_total', 'Chrome sessions launched')
+METRICS.counter('instaunfollower_driver_restarts_total', 'Browsers replaced, by reason')
+METRICS.gauge('instaunfollower_task_queue_depth', 'Tasks waiting behind the running one')
+METRICS.gauge('instaunfollower_unfollow_queue_remaining', 'Accounts left in the running unfollow job')
+
+
+class SessionStore:
+    """On-disk store of authenticated cookies and local storage, one file per username"""
+
+    def __init__(self, directory='sessions'):
+        self.directory = directory
+
+    def _path(self, username):
+        return os.path.join(self.directory, f"{username.lower()}.json")
+
+    def has(self, username):
+        return os.path.exists(self._path(username))
+
+    def load(self, username):
+        """Return the saved session for username, or None"""
+        try:
+            with open(self._path(username), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, username, cookies, local_storage):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(username)
+        session = {'username': username, 'saved_at': time.time(), 'cookies': cookies, 'local_storage': local_storage}
+        # Session cookies are as good as a password, so keep the file private to this user
+        fd = os.open(path + '.tmp', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(session, f)
+        os.replace(path + '.tmp', path)
+
+    def delete(self, username):
+        try:
+            os.remove(self._path(username))
+        except OSError:
+            pass
+
+
+class SnapshotStore:
+    """SQLite store of follower/following snapshots keyed by account, list kind and timestamp"""
+
+    def __init__(self, path='snapshots.db'):
+        self.path = path
+        with self._connect() as db:
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    account TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    taken_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    profile_count INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS snapshots_by_account ON snapshots (account, kind, taken_at);
+                CREATE TABLE IF NOT EXISTS snapshot_members (
+                    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+                    username TEXT NOT NULL,
+                    PRIMARY KEY (snapshot_id, username)
+                ) WITHOUT ROWID;
+            """)
+
+    def _connect(self):
+        # One connection per call, the store is used from both the UI and the scraper thread
+        return sqlite3.connect(self.path)
+
+    def save(self, account, kind, usernames, profile_count=None):
+        """Store a snapshot of a full list and return its id"""
+        members = sorted(set(usernames))
+        with self._connect() as db:
+            cursor = db.execute(
+                "INSERT INTO snapshots (account, kind, taken_at, size, profile_count) VALUES (?, ?, ?, ?, ?)",
+                (account.lower(), kind, time.time(), len(members), profile_count)
+            )
+            snapshot_id = cursor.lastrowid
+            db.executemany(
+                "INSERT INTO snapshot_members (snapshot_id, username) VALUES (?, ?)",
+                ((snapshot_id, username) for username in members)
+            )
+        return snapshot_id
+
+    def snapshots(self, account, kind, limit=None):
+        """List snapshot metadata (newest first) for one account's list"""
+        query = "SELECT id, taken_at, size, profile_count FROM snapshots WHERE account = ? AND kind = ? ORDER BY taken_at DESC"
+        params = [account.lower(), kind]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as db:
+            rows = db.execute(query, params).fetchall()
+        return [{'id': row[0], 'taken_at': row[1], 'size': row[2], 'profile_count': row[3]} for row in rows]
+
+    def members(self, snapshot_id):
+        with self._connect() as db:
+            rows = db.execute("SELECT username FROM snapshot_members WHERE snapshot_id = ?", (snapshot_id,)).fetchall()
+        return {row[0] for row in rows}
+
+    def latest(self, account, kind):
+        """Return the newest snapshot with its usernames, or None"""
+        snapshots = self.snapshots(account, kind, limit=1)
+        if not snapshots:
+            return None
+        snapshot = snapshots[0]
+        snapshot['usernames'] = self.members(snapshot['id'])
+        return snapshot
+
+    def diff(self, old_id, new_id):
+        """Return (added, removed) usernames between two snapshots"""
+        query = """
+            SELECT username FROM snapshot_members WHERE snapshot_id = ?
+            EXCEPT
+            SELECT username FROM snapshot_members WHERE snapshot_id = ?
+            ORDER BY username
+        """
+        with self._connect() as db:
+            added = [row[0] for row in db.execute(query, (new_id, old_id))]
+            removed = [row[0] for row in db.execute(query, (old_id, new_id))]
+        return added, removed
+
+
+class FollowGraph:
+    """Set algebra and rankings over stored snapshots, with usernames interned to integer ids
+
+    Each snapshot becomes a sorted uint32 array (NumPy) or a frozenset of ints (no NumPy), so
+    intersections and differences over 100k-user lists never hash strings twice, and ids are
+    shared across accounts so overlaps between them are plain array operations.
+    """
+
+    SECONDS_PER_DAY = 86400
+
+    def __init__(self, store, cache_size=16):
+        self.store = store
+        self.ids = {}
+        self.names = []
+        self.cache_size = cache_size
+        self._members = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def _intern(self, usernames):
+        ids = self.ids
+        names = self.names
+        interned = []
+        for username in usernames:
+            user_id = ids.get(username)
+            if user_id is None:
+                user_id = ids[username] = len(names)
+                names.append(username)
+            interned.append(user_id)
+        if np is not None:
+            return np.unique(np.fromiter(interned, dtype=np.uint32, count=len(interned)))
+        return frozenset(interned)
+
+    def members(self, snapshot_id):
+        """Interned members of one snapshot, cached since snapshots never change"""
+        with self.lock:
+            members = self._members.get(snapshot_id)
+            if members is not None:
+                self._members.move_to_end(snapshot_id)
+                return members
+        usernames = self.store.members(snapshot_id)
+        with self.lock:
+            members = self._members[snapshot_id] = self._intern(usernames)
+            while len(self._members) > self.cache_size:
+                self._members.popitem(last=False)
+        return members
+
+    def usernames(self, ids):
+        names = self.names
+        return sorted(names[user_id] for user_id in ids)
+
+    @staticmethod
+    def _and(a, b):
+        return np.intersect1d(a, b, assume_unique=True) if np is not None else a & b
+
+    @staticmethod
+    def _sub(a, b):
+        return np.setdiff1d(a, b, assume_unique=True) if np is not None else a - b
+
+    @staticmethod
+    def _union(a, b):
+        return np.union1d(a, b) if np is not None else a | b
+
+    @staticmethod
+    def _empty():
+        return np.empty(0, dtype=np.uint32) if np is not None else frozenset()
+
+    def report(self, account, stale_days=30, lost_days=30, history=60):
+        """Mutuals, non-followers ranked by how long we've followed them, recently lost and stale accounts
+
+        Follow age is only known back to the oldest snapshot in `history`, so it is a lower bound.
+        """
+        following_snapshots = self.store.snapshots(account, 'following', limit=history)
+        follower_snapshots = self.store.snapshots(account, 'followers', limit=history)
+        if not following_snapshots or not follower_snapshots:
+            return None
+        latest_following = self.members(following_snapshots[0]['id'])
+        latest_followers = self.members(follower_snapshots[0]['id'])
+        now = time.time()
+
+        mutuals = self._and(latest_following, latest_followers)
+        non_followers = self._sub(latest_following, latest_followers)
+
+        # Walk back through following snapshots while each non-follower is still in them
+        followed_since = self._followed_since(non_followers, following_snapshots)
+        if np is not None:
+            # Ids follow interning order, which depends on set iteration - break age ties by name instead
+            names = np.array([self.names[user_id] for user_id in non_followers], dtype=str)
+            order = np.lexsort((names, followed_since))
+            ranked = names[order].tolist()
+            days = (now - followed_since[order]) / self.SECONDS_PER_DAY
+            ages = dict(zip(ranked, days.astype(int).tolist()))
+        else:
+            ranked = sorted(non_followers, key=lambda user_id: (followed_since[user_id], self.names[user_id]))
+            ranked = [self.names[user_id] for user_id in ranked]
+            ages = {self.names[user_id]: int((now - since) / self.SECONDS_PER_DAY) for user_id, since in followed_since.items()}
+
+        # Anyone in a followers snapshot from the window who isn't following us now
+        lost = self._empty()
+        for snapshot in follower_snapshots[1:]:
+            if now - snapshot['taken_at'] > lost_days * self.SECONDS_PER_DAY:
+                break
+            lost = self._union(lost, self._sub(self.members(snapshot['id']), latest_followers))
+
+        return {
+            'mutuals': len(mutuals),
+            'non_followers': ranked,
+            'followed_days': ages,
+            'stale': [username for username in ranked if ages[username] >= stale_days],
+            'lost_followers': self.usernames(lost),
+        }
+
+    def _followed_since(self, non_followers, snapshots):
+        """Earliest snapshot time of each user's unbroken streak in the following list"""
+        if np is not None:
+            since = np.full(len(non_followers), snapshots[0]['taken_at'])
+            alive = np.ones(len(non_followers), dtype=bool)
+            for snapshot in snapshots[1:]:
+                alive &= np.isin(non_followers, self.members(snapshot['id']), assume_unique=True)
+                if not alive.any():
+                    break
+                since[alive] = snapshot['taken_at']
+            return since
+        since = dict.fromkeys(non_followers, snapshots[0]['taken_at'])
+        alive = set(non_followers)
+        for snapshot in snapshots[1:]:
+            alive &= self.members(snapshot['id'])
+            if not alive:
+                break
+            for user_id in alive:
+                since[user_id] = snapshot['taken_at']
+        return since
+
+    def overlap(self, accounts, kind='following'):
+        """Users in the latest `kind` list of at least two of our accounts, most shared first"""
+        latest = [self.store.snapshots(account, kind, limit=1) for account in accounts]
+        arrays = [self.members(snapshots[0]['id']) for snapshots in latest if snapshots]
+        if len(arrays) < 2:
+            return []
+        if np is not None:
+            user_ids, counts = np.unique(np.concatenate(arrays), return_counts=True)
+            mask = counts >= 2
+            shared = [(self.names[user_id], int(count)) for user_id, count in zip(user_ids[mask], counts[mask])]
+        else:
+            counts = collections.Counter(user_id for members in arrays for user_id in members)
+            shared = [(self.names[user_id], count) for user_id, count in counts.items() if count >= 2]
+        return sorted(shared, key=lambda item: (-item[1], item[0]))
+
+
+class ProfileCache:
+    """Per-username profile metadata in SQLite with a TTL, fronted by an in-memory LRU
+
+    Rows hold exists/private/verified/business, the follower count and the last seen follow
+    state; a field left as None means it wasn't known when the row was written. A deleted
+    account can come back (deactivation is temporary), so exists=False expires after negative_ttl.
+    """
+
+    FIELDS = ('exists', 'private', 'verified', 'business', 'followers', 'follow_state', 'full_name')
+
+    def __init__(self, path='profiles.db', ttl=7 * 24 * 3600, negative_ttl=6 * 3600, capacity=5000):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.capacity = capacity
+        self.memory = collections.OrderedDict()
+        self.lock = threading.Lock()
+        # Writers read, merge and write back - one at a time, or two threads drop each other's fields
+        self.write_lock = threading.Lock()
+        with self._connect() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS profiles (
+                    username TEXT PRIMARY KEY,
+                    "exists" INTEGER,
+                    private INTEGER,
+                    verified INTEGER,
+                    business INTEGER,
+                    followers INTEGER,
+                    follow_state TEXT,
+                    full_name TEXT,
+                    updated_at REAL NOT NULL
+                ) WITHOUT ROWID
+            """)
+            db.execute("DELETE FROM profiles WHERE updated_at < ?", (time.time() - ttl,))
+
+    def _connect(self):
+        # Same as SnapshotStore - the scraper, pipeline and worker threads each get their own connection
+        return sqlite3.connect(self.path)
+
+    def _remember(self, username, profile):
+        with self.lock:
+            self.memory[username] = profile
+            self.memory.move_to_end(username)
+            while len(self.memory) > self.capacity:
+                self.memory.popitem(last=False)
+
+    def get(self, username):
+        """Fresh metadata for username, or None"""
+        return self.get_many([username]).get(username)
+
+    def _fresh(self, profile, now):
+        ttl = self.negative_ttl if profile['exists'] is False else self.ttl
+        return profile['updated_at'] >= now - ttl
+
+    def get_many(self, usernames):
+        """{username: metadata} for every username with a fresh entry, memory first, one query per 500 misses"""
+        now = time.time()
+        cutoff = now - self.ttl
+        found, missing = {}, []
+        with self.lock:
+            for username in usernames:
+                profile = self.memory.get(username)
+                if profile is not None and self._fresh(profile, now):
+                    self.memory.move_to_end(username)
+                    found[username] = profile
+                else:
+                    missing.append(username)
+        columns = ', '.join(f'"{field}"' for field in self.FIELDS)
+        with self._connect() as db:
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                rows = db.execute(
+                    f"SELECT username, {columns}, updated_at FROM profiles "
+                    f"WHERE updated_at >= ? AND username IN ({', '.join('?' * len(chunk))})",
+                    [cutoff] + chunk
+                ).fetchall()
+                for row in rows:
+                    profile = self._row(row)
+                    if not self._fresh(profile, now):
+                        continue
+                    self._remember(row[0], profile)
+                    found[row[0]] = profile
+        return found
+
+    def _row(self, row):
+        profile = dict(zip(self.FIELDS, row[1:-1]))
+        for flag in ('exists', 'private', 'verified', 'business'):
+            if profile[flag] is not None:
+                profile[flag] = bool(profile[flag])
+        profile['updated_at'] = row[-1]
+        return profile
+
+    def put(self, username, **fields):
+        self.put_many({username: fields})
+
+    def put_many(self, updates):
+        """Merge {username: {field: value}} into the cache, writing through to SQLite in one transaction
+
+        Fields left out keep their cached value; a field passed as None is cleared.
+        """
+        if not updates:
+            return
+        columns = ', '.join(f'"{field}"' for field in self.FIELDS)
+        with self.write_lock:
+            now = time.time()
+            current = self.get_many(list(updates))
+            merged = []
+            for username, fields in updates.items():
+                profile = dict.fromkeys(self.FIELDS)
+                profile.update(current.get(username, {}))
+                profile.update((field, value) for field, value in fields.items() if field in self.FIELDS)
+                profile['updated_at'] = now
+                merged.append((username, profile))
+            with self._connect() as db:
+                db.executemany(
+                    f"INSERT OR REPLACE INTO profiles (username, {columns}, updated_at) VALUES (?, {', '.join('?' * len(self.FIELDS))}, ?)",
+                    [(username,) + tuple(profile[field] for field in self.FIELDS) + (now,) for username, profile in merged]
+                )
+            # Memory only changes once the row is on disk, so a failed write leaves both in step
+            for username, profile in merged:
+                self._remember(username, profile)
+
+
+class UnfollowJournal:
+    """Append-only write-ahead journal of an account's unfollow job, one JSON record per line
+
+    Each user moves pending -> attempted -> confirmed/failed. Records are flushed to the OS on
+    every write (survives an app crash) and fsynced in batches (survives a power cut).
+    """
+
+    def __init__(self, account, directory='journals', sync_every=25, sync_interval=2.0):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{account.lower()}.jsonl")
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.lock = threading.Lock()
+        self.file = None
+        self.job_id = None
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def _read(self):
+        """Replay the journal into (job_id, ordered users, {user: (state, reason)}, finished)"""
+        job_id, users, states, finished = None, [], {}, True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn final write from a crash
+                    if record.get('event') == 'start':
+                        job_id, users, states, finished = record['job'], [], {}, False
+                    elif record.get('event') == 'done' and record.get('job') == job_id:
+                        finished = True
+                    elif record.get('job') == job_id and 'user' in record:
+                        if record['user'] not in states:
+                            users.append(record['user'])
+                        states[record['user']] = (record['state'], record.get('reason', ''))
+        except OSError:
+            pass
+        return job_id, users, states, finished
+
+    def unfinished_job(self):
+        """Return {'job', 'users', 'states', 'remaining'} for an interrupted job, or None"""
+        job_id, users, states, finished = self._read()
+        if job_id is None or finished:
+            return None
+        remaining = [user for user in users if states[user][0] != 'confirmed']
+        if not remaining:
+            return None
+        return {'job': job_id, 'users': users, 'states': states, 'remaining': remaining}
+
+    def last_job(self):
+        """Return {'job', 'finished', 'states'} for the newest job in the journal, or None"""
+        job_id, users, states, finished = self._read()
+        if job_id is None:
+            return None
+        return {'job': job_id, 'finished': finished, 'states': {user: states[user] for user in users}}
+
+    def start_job(self, users):
+        """Start a new job, replacing whatever the journal held before"""
+        with self.lock:
+            self.job_id = f"{int(time.time())}-{os.getpid()}"
+            self.file = open(self.path, 'w', encoding='utf-8')
+            self._write({'event': 'start', 'job': self.job_id, 't': time.time()})
+            for user in users:
+                self._write({'job': self.job_id, 'user': user, 'state': 'pending'})
+            self._sync()
+
+    def resume_job(self):
+        """Reopen the interrupted job for appending and return its per-user states"""
+        job = self.unfinished_job()
+        if job is None:
+            return None
+        with self.lock:
+            self.job_id = job['job']
+            self.file = open(self.path, 'a', encoding='utf-8')
+        return job['states']
+
+    def record(self, user, state, reason=''):
+        with self.lock:
+            if self.file is None:
+                return
+            self._write({'job': self.job_id, 'user': user, 'state': state, 'reason': reason, 't': time.time()})
+            if self.unsynced >= self.sync_every or time.monotonic() - self.last_sync >= self.sync_interval:
+                self._sync()
+
+    def finish_job(self):
+        with self.lock:
+            if self.file is None:
+                return
+            self._write({'event': 'done', 'job': self.job_id, 't': time.time()})
+            self._close()
+
+    def close(self):
+        with self.lock:
+            self._close()
+
+    def _write(self, record):
+        self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+        self.unsynced += 1
+
+    def _sync(self):
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def _close(self):
+        if self.file is not None:
+            self._sync()
+            self.file.close()
+            self.file = None
+
+
+class SelectorRegistry:
+    """Named groups of fallback selectors, raced in one query with the last winner tried first
+
+    Hits, match latency and misses per selector persist to disk so the order survives restarts,
+    and a change of winner is reported as markup drift.
+    """
+
+    GROUPS = {
+        'login.username': [
+            (By.NAME, "username"),
+            (By.XPATH, "//input[@aria-label='Phone number, username, or email']"),
+            (By.XPATH, "//input[@placeholder='Phone number, username, or email']"),
+            (By.XPATH, "//input[contains(@class, '_aa4b') and @type='text']"),
+            (By.XPATH, "//input[@autocomplete='username']"),
+            (By.CSS_SELECTOR, "input[name='username']"),
+            (By.CSS_SELECTOR, "input[type='text']:first-of-type"),
+        ],
+        'login.password': [
+            (By.NAME, "password"),
+            (By.XPATH, "//input[@aria-label='Password']"),
+            (By.XPATH, "//input[@placeholder='Password']"),
+            (By.XPATH, "//input[contains(@class, '_aa4b') and @type='password']"),
+            (By.XPATH, "//input[@autocomplete='current-password']"),
+            (By.CSS_SELECTOR, "input[name='password']"),
+            (By.CSS_SELECTOR, "input[type='password']"),
+        ],
+        'unfollow.following_button': [
+            (By.XPATH, "//button[contains(text(), 'Following')]"),
+            (By.XPATH, "//button[contains(text(), 'Requested')]"),
+            (By.XPATH, "//button[contains(@aria-label, 'Following')]"),
+            (By.XPATH, "//button[contains(@aria-label, 'Requested')]"),
+            (By.XPATH, "//button[contains(., 'Following')]"),
+            (By.XPATH, "//button[contains(., 'Requested')]"),
+            (By.XPATH, "//div[contains(@role, 'button') and contains(text(), 'Following')]"),
+            (By.XPATH, "//div[contains(@role, 'button') and contains(text(), 'Requested')]"),
+        ],
+        'unfollow.confirm_button': [
+            (By.XPATH, "//button[contains(text(), 'Unfollow')]"),
+            (By.XPATH, "//button[contains(@aria-label, 'Unfollow')]"),
+            (By.XPATH, "//button[text()='Unfollow']"),
+            (By.XPATH, "//div[contains(@role, 'button') and contains(text(), 'Unfollow')]"),
+        ],
+    }
+
+    def __init__(self, path='selector_stats.json'):
+        self.path = path
+        self.lock = threading.Lock()
+        self.stats = {}
+        try:
+            with open(self.path, 'r') as f:
+                self.stats = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def ordered(self, group):
+        """The group's selectors, last winner first, then by hit count, then as declared"""
+        with self.lock:
+            stats = self.stats.get(group, {})
+            winner = stats.get('winner')
+            hits = {selector: entry['hits'] for selector, entry in stats.get('selectors', {}).items()}
+        return sorted(self.GROUPS[group], key=lambda strategy: (strategy[1] != winner, -hits.get(strategy[1], 0)))
+
+    def find(self, driver, group, timeout, log, clickable=False):
+        """Race every selector of the group in one script per poll, returns (element, selector) or (None, None)"""
+        strategies = self.ordered(group)
+        queries = [self._query(by, selector) for by, selector in strategies]
+        started = time.monotonic()
+        with TRACER.span(f"selector.{group}") as span:
+            try:
+                index, element = WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                    lambda d: d.execute_script(SELECTOR_RACE_JS, queries, clickable)
+                )
+            except TimeoutException:
+                index, element = None, None
+                span.set('miss')
+                METRICS.inc('instaunfollower_selector_misses_total', group=group)
+        elapsed = time.monotonic() - started
+
+        with self.lock:
+            stats = self.stats.setdefault(group, {'winner': None, 'misses': 0, 'selectors': {}})
+            if index is None:
+                stats['misses'] += 1
+                log(f"🧭 No selector for {group} matched within {timeout}s - Instagram may have changed its markup", WARNING)
+                return None, None
+            selector = strategies[index][1]
+            entry = stats['selectors'].setdefault(selector, {'hits': 0, 'seconds': 0.0})
+            entry['hits'] += 1
+            entry['seconds'] += elapsed
+            previous, stats['winner'] = stats['winner'], selector
+        if previous is not None and previous != selector:
+            log(f"🧭 Markup drift on {group}: {selector!r} matched after {previous!r} stopped working", WARNING)
+        return element, selector
+
+    def summary(self):
+        """One line per group: current winner with its hit count and average match time, plus misses"""
+        lines = []
+        with self.lock:
+            for group, stats in sorted(self.stats.items()):
+                winner = stats['selectors'].get(stats['winner'])
+                if winner:
+                    lines.append(f"{group}: {stats['winner']!r} {winner['hits']} hits, "
+                                 f"avg {winner['seconds'] / winner['hits'] * 1000:.0f}ms, {stats['misses']} misses")
+        return lines
+
+    def save(self):
+        with self.lock:
+            try:
+                with open(self.path + '.tmp', 'w') as f:
+                    json.dump(self.stats, f, indent=2)
+                os.replace(self.path + '.tmp', self.path)
+            except OSError:
+                pass
+
+    def _query(self, by, selector):
+        if by == By.XPATH:
+            return ['xpath', selector]
+        if by == By.NAME:
+            return ['css', f"[name='{selector}']"]
+        return ['css', selector]
+
+
+class PacingScheduler:
+    """Spaces unfollows inside hourly/daily budgets and follows what the server is telling us
+
+    Action blocks push the next slot out exponentially. Gaps only shrink while latency and success
+    rate show headroom. Budget usage and backoff persist per account, so a restart can't reset them.
+    """
+
+    def __init__(self, account, interval=(8, 16), min_interval=2.0, per_hour=60, per_day=200,
+                 backoff_base=900, max_backoff=4 * 3600, directory='pacing'):
+        self.directory = directory
+        self.path = os.path.join(directory, f"{account.lower()}.json")
+        self.interval = interval
+        self.min_interval = min_interval
+        self.per_hour = per_hour
+        self.per_day = per_day
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+        self.latencies = collections.deque(maxlen=20)
+        self.outcomes = collections.deque(maxlen=20)
+        self.baseline = None
+        self.streak = 0
+        self.speed = 1.0
+        self.actions = collections.deque()
+        self.backoff_level = 0
+        self.blocked_until = 0.0
+        self._load()
+
+    def reserve(self, max_wait):
+        """Claim the next action slot, returns (seconds to wait, why, slot) or (None, why, None) past max_wait"""
+        with self.lock:
+            now = time.time()
+            waits = {
+                'pace': self.next_at,
+                'hourly budget': self._budget_free_at(now, 3600, self.per_hour),
+                'daily budget': self._budget_free_at(now, 86400, self.per_day),
+                'backoff': self.blocked_until,
+            }
+            reason = max(waits, key=waits.get)
+            slot = max(now, waits[reason])
+            if slot - now > max_wait:
+                return None, reason, None
+            self.next_at = slot + max(self.min_interval, random.uniform(*self.interval) * self.speed)
+            self.actions.append(slot)
+            return slot - now, reason, slot
+
+    def release(self, slot):
+        """Give back a slot from reserve() that went unused - other workers' reservations stay put"""
+        with self.lock:
+            try:
+                self.actions.remove(slot)
+            except ValueError:
+                return
+            # Nobody reserved after it, so the pace clock can go back to when this slot was due
+            if not self.actions or self.actions[-1] < slot:
+                self.next_at = min(self.next_at, slot)
+
+    def in_backoff(self):
+        return time.time() < self.blocked_until
+
+    def record(self, status, latency):
+        """Feed back how an action went: its status and how long the page took"""
+        with self.lock:
+            now = time.time()
+            self.outcomes.append(status in ('confirmed', 'gone'))
+            if status == 'blocked':
+                self.streak = 0
+                self.speed = max(1.0, self.speed)
+                # Several workers can hit the same block - it only counts once
+                if now >= self.blocked_until:
+                    self.backoff_level += 1
+                    backoff = min(self.max_backoff, self.backoff_base * 2 ** (self.backoff_level - 1))
+                    self.blocked_until = now + backoff * random.uniform(1.0, 1.2)
+            else:
+                self.latencies.append(latency)
+                if self.baseline is None and len(self.latencies) >= 5:
+                    self.baseline = statistics.median(self.latencies)
+                if status == 'confirmed':
+                    self.streak += 1
+                    if self.streak >= 10 and self.backoff_level:
+                        self.backoff_level -= 1
+                        self.streak = 0
+                self._adapt(now)
+            self._save()
+
+    def _adapt(self, now):
+        if self.baseline is None or len(self.outcomes) < 5:
+            return
+        success = sum(self.outcomes) / len(self.outcomes)
+        recent = statistics.median(list(self.latencies)[-5:])
+        used = sum(1 for t in self.actions if t > now - 3600)
+        if success >= 0.9 and recent <= self.baseline * 1.25 and used < self.per_hour * 0.75 and not self.backoff_level:
+            self.speed = max(0.5, self.speed * 0.9)
+        elif success < 0.7 or recent > self.baseline * 2:
+            self.speed = min(2.0, self.speed * 1.25)
+        else:
+            self.speed += (1.0 - self.speed) * 0.2
+
+    def eta(self, remaining, workers=1):
+        """Rough seconds left for `remaining` actions at the current pace and budgets"""
+        if remaining <= 0:
+            return 0.0
+        with self.lock:
+            now = time.time()
+            latency = sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+            gap = max(self.min_interval, sum(self.interval) / 2 * self.speed, latency / workers)
+            estimate = max(0.0, self.next_at - now, self.blocked_until - now) + (remaining - 1) * gap + latency
+            # Whatever doesn't fit in this hour's/day's budget waits for the next window
+            hour_left = max(0, self.per_hour - sum(1 for t in self.actions if t > now - 3600))
+            day_left = max(0, self.per_day - len(self.actions))
+            if remaining > hour_left:
+                estimate = max(estimate, (remaining - hour_left) / self.per_hour * 3600)
+            if remaining > day_left:
+                estimate = max(estimate, (remaining - day_left) / self.per_day * 86400)
+            return estimate
+
+    def _budget_free_at(self, now, window, budget):
+        """Earliest time another action fits in the rolling window"""
+        while self.actions and self.actions[0] <= now - 86400:
+            self.actions.popleft()
+        recent = [t for t in self.actions if t > now - window]
+        if len(recent) < budget:
+            return 0.0
+        return recent[len(recent) - budget] + window
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        cutoff = time.time() - 86400
+        self.actions.extend(t for t in state.get('actions', []) if t > cutoff)
+        self.backoff_level = state.get('backoff_level', 0)
+        self.blocked_until = state.get('blocked_until', 0.0)
+
+    def _save(self):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            state = {'actions': list(self.actions), 'backoff_level': self.backoff_level, 'blocked_until': self.blocked_until}
+            with open(self.path + '.tmp', 'w') as f:
+                json.dump(state, f)
+            os.replace(self.path + '.tmp', self.path)
+        except OSError:
+            pass
+
+
+class BrowserLocator:
+    """Finds Chrome/Chromium and a matching chromedriver once, then reuses the answer from a cache file"""
+
+    CHROME_PATHS = {
+        'win32': [
+            r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+            os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe"),
+            os.path.expanduser(r"~\AppData\Local\Chromium\Application\chrome.exe"),
+        ],
+        'darwin': [
+            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+            "/Applications/Chromium.app/Contents/MacOS/Chromium",
+            os.path.expanduser("~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"),
+        ],
+        'linux': [
+            "/usr/bin/google-chrome",
+            "/usr/bin/google-chrome-stable",
+            "/opt/google/chrome/chrome",
+            "/usr/bin/chromium",
+            "/usr/bin/chromium-browser",
+            "/snap/bin/chromium",
+        ],
+    }
+    CHROME_COMMANDS = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome']
+
+    def __init__(self, cache_file='browser_cache.json'):
+        self.cache_file = cache_file
+        self.resolved = None
+        self.lock = threading.Lock()
+
+    def resolve(self, log):
+        """Return (chrome_path, chromedriver_path), either may be None when it can't be found"""
+        with self.lock:
+            if self.resolved is None or not all(self._still_valid(entry) for entry in self.resolved.values()):
+                self.resolved = self._resolve(log)
+            return self.resolved['chrome'] and self.resolved['chrome']['path'], self.resolved['driver'] and self.resolved['driver']['path']
+
+    def forget(self):
+        """Drop the cached answer, e.g. after Chrome failed to start with it"""
+        with self.lock:
+            self.resolved = None
+            try:
+                os.remove(self.cache_file)
+            except OSError:
+                pass
+
+    def _resolve(self, log):
+        timings = []
+
+        def timed(step, func, *args):
+            started = time.perf_counter()
+            result = func(*args)
+            timings.append((step, time.perf_counter() - started))
+            return result
+
+        chrome_override = os.environ.get('INSTA_CHROME_PATH')
+        driver_override = os.environ.get('INSTA_CHROMEDRIVER_PATH')
+        cached = timed('cache', self._load_cache)
+        chrome = cached.get('chrome')
+        driver = cached.get('driver')
+
+        if chrome_override:
+            chrome = timed('chrome', self._entry, chrome_override)
+        elif not self._still_valid(chrome):
+            chrome = timed('chrome', self._find_chrome)
+        if driver_override:
+            driver = timed('chromedriver', self._entry, driver_override)
+        elif not self._still_valid(driver) or not self._same_major(chrome, driver):
+            driver = timed('chromedriver', self._find_driver, chrome, log)
+
+        resolved = {'chrome': chrome, 'driver': driver}
+        if resolved != {'chrome': cached.get('chrome'), 'driver': cached.get('driver')}:
+            timed('cache_write', self._save_cache, resolved)
+
+        if chrome:
+            log(f"✅ Chrome discovered hiding at: {chrome['path']} (version {chrome['version'] or 'unknown'})", SUCCESS)
+        if driver:
+            log(f"✅ ChromeDriver tamed and chained at: {driver['path']} (version {driver['version'] or 'unknown'})", SUCCESS)
+        for step, elapsed in timings:
+            log(f"⏱️ discovery.{step}: {elapsed * 1000:.1f}ms", DEBUG)
+        return resolved
+
+    def _find_chrome(self):
+        platform = 'linux' if sys.platform.startswith('linux') else sys.platform
+        candidates = list(self.CHROME_PATHS.get(platform, []))
+        candidates += [shutil.which(command) for command in self.CHROME_COMMANDS]
+        for path in candidates:
+            if path and os.path.isfile(path):
+                return self._entry(path)
+        return None
+
+    def _find_driver(self, chrome, log):
+        # A chromedriver already on PATH (distro packages ship one next to Chromium) saves a download
+        path = shutil.which('chromedriver')
+        if path:
+            entry = self._entry(path)
+            if self._same_major(chrome, entry):
+                return entry
+        try:
+            path = chromedriver_autoinstaller.install()
+        except Exception as e:
+            log(f"⚠️ ChromeDriver threw a tantrum during installation: {str(e)}", WARNING)
+            return None
+        return self._entry(path) if path else None
+
+    def _entry(self, path):
+        """Describe a binary by path, version and the stat fields used to validate the cache"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return {'path': path, 'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'version': self._version(path)}
+
+    def _version(self, path):
+        try:
+            output = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        match = re.search(r'(\d+\.\d+\.\d+\.\d+)', output)
+        return match.group(1) if match else None
+
+    def _same_major(self, chrome, driver):
+        if not chrome or not driver or not chrome['version'] or not driver['version']:
+            return True
+        return chrome['version'].split('.')[0] == driver['version'].split('.')[0]
+
+    def _still_valid(self, entry):
+        """Cheap check that a cached binary is still the one we probed"""
+        if not entry:
+            return False
+        try:
+            stat = os.stat(entry['path'])
+        except OSError:
+            return False
+        return stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime']
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, resolved):
+        try:
+            with open(self.cache_file + '.tmp', 'w') as f:
+                json.dump(dict(resolved, resolved_at=time.time()), f, indent=2)
+            os.replace(self.cache_file + '.tmp', self.cache_file)
+        except OSError:
+            pass
+
+
+# Resolved once per process, then revalidated with a stat per launch
+BROWSER_LOCATOR = BrowserLocator()
+
+
+class DriverPool:
+    """Process-wide pool of warm Chrome sessions, reset between checkouts so accounts never share state"""
+
+    def __init__(self, size=1, max_tasks=50, max_memory_mb=1500):
+        self.size = size
+        self.max_tasks = max_tasks
+        self.max_memory_mb = max_memory_mb
+        self.idle = []
+        self.tasks = {}
+        self.warming = 0
+        self.lock = threading.Condition()
+        self.closed = False
+
+    def checkout(self, factory):
+        """Hand out a healthy idle driver, or launch one with `factory` when none is warm"""
+        while True:
+            with self.lock:
+                # A browser that's already launching beats starting a second one
+                while not self.idle and self.warming:
+                    self.lock.wait()
+                driver = self.idle.pop() if self.idle else None
+            if driver is None:
+                break
+            if self._healthy(driver):
+                return driver
+            METRICS.inc('instaunfollower_driver_restarts_total', reason='unhealthy')
+            self.discard(driver)
+
+        driver = factory()
+        if driver is not None:
+            with self.lock:
+                self.tasks[driver] = 0
+        return driver
+
+    def release(self, driver):
+        """Wipe the driver's cookies/storage and park it for the next checkout"""
+        if driver is None:
+            return
+        with self.lock:
+            full = self.closed or len(self.idle) >= self.size
+        if full or self._worn_out(driver) or not self._reset(driver):
+            self.discard(driver)
+            return
+        with self.lock:
+            self.idle.append(driver)
+
+    def task_done(self, driver):
+        """Count a finished task, returns True when the driver should be swapped for a fresh one"""
+        with self.lock:
+            if driver not in self.tasks:
+                return False
+            self.tasks[driver] += 1
+        return self._worn_out(driver)
+
+    def discard(self, driver):
+        with self.lock:
+            self.tasks.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def warm(self, factory):
+        """Launch drivers in the background until `size` are idle"""
+        def fill():
+            while True:
+                with self.lock:
+                    if self.closed or len(self.idle) >= self.size:
+                        return
+                    self.warming += 1
+                try:
+                    driver = factory()
+                    if driver is not None:
+                        with self.lock:
+                            self.tasks[driver] = 0
+                        self.release(driver)
+                finally:
+                    with self.lock:
+                        self.warming -= 1
+                        self.lock.notify_all()
+                if driver is None:
+                    return
+
+        threading.Thread(target=fill, name="driver-pool-warmup", daemon=True).start()
+
+    def shutdown(self):
+        with self.lock:
+            self.closed = True
+            idle, self.idle = self.idle, []
+        for driver in idle:
+            self.discard(driver)
+
+    def _healthy(self, driver):
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _worn_out(self, driver):
+        with self.lock:
+            tasks = self.tasks.get(driver, 0)
+        if tasks >= self.max_tasks:
+            return True
+        memory = self._memory_mb(driver)
+        return memory is not None and memory > self.max_memory_mb
+
+    def _memory_mb(self, driver):
+        """RSS of chromedriver plus every Chrome process under it, None without psutil"""
+        if psutil is None:
+            return None
+        try:
+            root = psutil.Process(driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+            return sum(process.memory_info().rss for process in processes) / (1024 * 1024)
+        except (psutil.Error, AttributeError):
+            return None
+
+    def _reset(self, driver):
+        """Close extra tabs and clear every trace of the last account"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': INSTAGRAM_URL, 'storageTypes': 'all'})
+            driver.get('about:blank')
+            driver.get_log('performance')
+            return True
+        except Exception:
+            return False
+
+
+# Shared by every scraper in the process so switching accounts skips the browser launch
+DRIVER_POOL = DriverPool()
+
+
+class Signal:
+    """Just enough of pyqtSignal for the engine to report back without Qt
+
+    Slots run on the emitting thread - the GUI forwards them into real Qt signals.
+    """
+
+    def __init__(self, *types):
+        self.types = types
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.__dict__.setdefault(self.name, BoundSignal())
+
+
+class BoundSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot=None):
+        """Drop one slot, or every slot when called without one"""
+        if slot is None:
+            self.slots = []
+        else:
+            self.slots = [connected for connected in self.slots if connected is not slot]
+
+    def emit(self, *args):
+        for slot in list(self.slots):
+            slot(*args)
+
+
+# One coalesced progress report: task kind, stage within it (list kind, unfollow mode), severity of the
+# latest item, its username, items done of total (0 when unknown), its duration and the rate/ETA so far
+ProgressEvent = collections.namedtuple('ProgressEvent', 'kind stage severity username index total duration rate eta')
+
+
+class ProgressStream:
+    """Turns per-item progress from any worker thread into at most one ProgressEvent per interval
+
+    Updates only assign attributes and draw from an itertools counter, so workers never block
+    on each other; an occasional extra event from two threads racing past the interval is harmless.
+    """
+
+    def __init__(self, emit, interval=0.25):
+        self.emit = emit
+        self.interval = interval
+        self.start('', '')
+
+    def start(self, kind, stage, total=0):
+        """Begin a new stage and report it straight away"""
+        self.kind = kind
+        self.stage = stage
+        self.total = total
+        self.done = 0
+        self.counter = itertools.count(1)
+        self.started = time.monotonic()
+        self.last_emit = 0.0
+        self.eta_hint = None
+        self.latest = None
+        if kind:
+            self._publish(ProgressEvent(kind, stage, INFO, '', 0, total, None, 0.0, None), time.monotonic())
+
+    def update(self, index=None, total=None, username='', severity=INFO, duration=None, advance=False, eta=None):
+        """Record progress: an absolute index, or advance=True to count one more finished item"""
+        now = time.monotonic()
+        if total is not None:
+            self.total = total
+        if advance:
+            index = next(self.counter)
+        if index is not None:
+            self.done = index
+        if eta is not None:
+            self.eta_hint = (eta, now)
+        elapsed = now - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        self.latest = ProgressEvent(self.kind, self.stage, severity, username, self.done, self.total,
+                                    duration, rate, self._eta(rate, now))
+        if severity >= ERROR or (self.total and self.done >= self.total) or now - self.last_emit >= self.interval:
+            self._publish(self.latest, now)
+
+    def _eta(self, rate, now):
+        # The pacing scheduler knows about budgets and backoff, so its estimate beats the raw rate
+        if self.eta_hint is not None:
+            eta, at = self.eta_hint
+            return max(0.0, eta - (now - at))
+        if rate > 0 and self.total:
+            return max(0, self.total - self.done) / rate
+        return None
+
+    def flush(self):
+        """Emit whatever the interval held back"""
+        if self.latest is not None:
+            self._publish(self.latest, time.monotonic())
+
+    def _publish(self, event, now):
+        self.last_emit = now
+        self.latest = None
+        self.emit(event)
+
+
+class TaskCancelled(Exception):
+    """Raised at a checkpoint once the running task has been cancelled"""
+
+
+class ScraperTask:
+    """One queued unit of work for the scraper thread, cancel() stops it at its next checkpoint"""
+
+    def __init__(self, kind, **params):
+        self.kind = kind
+        self.params = params
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+
+class UnfollowExecutor:
+    """Runs unfollows over several browser sessions pulling from one queue under the scraper's pacing"""
+
+    def __init__(self, scraper, usernames, workers, cancel_event):
+        self.scraper = scraper
+        self.cancel_event = cancel_event
+        self.workers = workers
+        self.queue = queue.Queue()
+        for username in usernames:
+            self.queue.put(username)
+        self.total = len(usernames)
+        self.stop_event = threading.Event()
+        self.results = {}
+        self.results_lock = threading.Lock()
+        self.worker_stats = {}
+
+    def run(self):
+        """Process the whole queue and return {username: (status, reason)}"""
+        # Extra sessions reuse the main session's cookies instead of logging in again
+        cookies = self.scraper.driver.get_cookies()
+        threads = []
+        for worker_id in range(self.workers):
+            self.worker_stats[worker_id] = {'done': 0, 'confirmed': 0}
+            thread = threading.Thread(target=self._worker, args=(worker_id, cookies), name=f"unfollow-worker-{worker_id}", daemon=True)
+            threads.append(thread)
+            thread.start()
+        # Poll instead of a plain join so a cancel reaches workers sleeping between slots right away
+        while any(thread.is_alive() for thread in threads):
+            if self.cancel_event.wait(0.2):
+                self.stop_event.set()
+            for thread in threads:
+                thread.join(0)
+
+        for worker_id, stats in sorted(self.worker_stats.items()):
+            self.scraper.log(f"🧵 Worker {worker_id + 1}: {stats['confirmed']}/{stats['done']} unfollowed")
+        if self.stop_event.is_set() and not self.queue.empty():
+            self.scraper.log(f"🛑 Stopped with {self.queue.qsize()} accounts left in the queue", WARNING)
+        return self.results
+
+    def _open_session(self, worker_id, cookies):
+        """Worker 0 drives the main session, the others get their own logged-in browser"""
+        if worker_id == 0:
+            return self.scraper.driver
+        driver = DRIVER_POOL.checkout(self.scraper._create_driver)
+        if driver is None:
+            return None
+        self.scraper._visit(f"{self.scraper.base_url}/robots.txt", 'robots', driver)
+        for cookie in cookies:
+            if 'expiry' in cookie:
+                cookie = dict(cookie, expiry=int(cookie['expiry']))
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException:
+                continue
+        return driver
+
+    def _worker(self, worker_id, cookies):
+        driver = None
+        try:
+            driver = self._open_session(worker_id, cookies)
+            if driver is None:
+                self.scraper.log(f"⚠️ Worker {worker_id + 1} couldn't start a browser - the others carry on", WARNING)
+                return
+
+            stats = self.worker_stats[worker_id]
+            while not self.stop_event.is_set():
+                try:
+                    username = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if not self.scraper._wait_for_slot(self.stop_event, self.queue.qsize() + 1, self.workers):
+                    self.queue.put(username)
+                    self.stop_event.set()
+                    break
+
+                self.scraper.journal.record(username, 'attempted')
+                started = time.monotonic()
+                try:
+                    status, reason = self.scraper._unfollow_on_page(driver, username)
+                except TaskCancelled:
+                    self.queue.put(username)
+                    self.stop_event.set()
+                    break
+                except Exception as e:
+                    status, reason = 'failed', str(e)[:50]
+                self.scraper.pacing.record(status, time.monotonic() - started)
+                if status == 'gone':
+                    status, reason = 'confirmed', 'account_gone'
+                self.scraper.journal.record(username, 'confirmed' if status == 'confirmed' else 'failed', reason)
+
+                if status == 'blocked':
+                    # Back in the queue - every worker now waits out the backoff before the next try
+                    self.scraper.log(f"🛑 Worker {worker_id + 1} hit an action block - all workers back off", ERROR)
+                    self.queue.put(username)
+                    continue
+
+                with self.results_lock:
+                    self.results[username] = (status, reason)
+                    done = len(self.results)
+                stats['done'] += 1
+                if status == 'confirmed':
+                    stats['confirmed'] += 1
+                self.scraper.log(f"🧵 Worker {worker_id + 1}: @{username} {status} ({done}/{self.total} overall)")
+        finally:
+            if driver is not None and worker_id != 0:
+                self.scraper._record_page(driver)
+                DRIVER_POOL.release(driver)
+
+
+class InstagramScraper:
+    login_result = Signal(bool, str)
+    scraping_complete = Signal(list)
+    unfollow_complete = Signal(str)
+    # Lifecycle of every queued task, with coalesced ProgressEvents while it runs
+    task_started = Signal(str)
+    progress_event = Signal(object)
+    task_failed = Signal(str, str)
+    task_cancelled = Signal(str)
+    task_finished = Signal(str)
+    
+    SIGNALS = ('login_result', 'scraping_complete', 'unfollow_complete', 'task_started', 'progress_event',
+               'task_failed', 'task_cancelled', 'task_finished')
+    
+    def __init__(self, dev_mode=False, log_pipeline=None, unfollow_workers=1, actions_per_minute=6,
+                 hourly_budget=60, daily_budget=200):
+        self.dev_mode = dev_mode
+        self.base_url = INSTAGRAM_URL
+        self.unfollow_workers = unfollow_workers
+        self.actions_per_minute = actions_per_minute
+        self.hourly_budget = hourly_budget
+        self.daily_budget = daily_budget
+        self.log_pipeline = log_pipeline or LogPipeline()
+        self.driver = None
+        self.username = ""
+        self.password = ""
+        self.tasks = queue.Queue()
+        self.current_task = None
+        self.thread = None
+        self.progress = ProgressStream(self.progress_event.emit)
+        # Persists and diffs one list's snapshot while the browser already harvests the next list
+        self.pipeline = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scrape-pipeline')
+        self.followers = set()
+        self.following = set()
+        self.users_to_unfollow = []
+        self.resume_unfollow = False
+        self.journal = None
+        self.unfollow_interval = (8, 16)
+        self.unfollow_mode = 'profile'
+        self.pacing = None
+        self.extraction_mode = 'network'
+        self.profiles = {}
+        self.pyautogui_fallback = True
+        self.unfollow_coords = None
+        self.coords_file = 'unfollow_coords.json'
+        self.step_stats = {}
+        self.step_stats_lock = threading.Lock()
+        self.browse_profile = 'lean'
+        self.page_load_strategy = None  # overrides the profile's strategy when set
+        self.page_stats = {}
+        self.open_pages = {}
+        self.session_store = SessionStore()
+        self.snapshot_store = SnapshotStore()
+        METRICS.gauge('instaunfollower_task_queue_depth', 'Tasks waiting behind the running one', self.tasks.qsize)
+        self.follow_graph = FollowGraph(self.snapshot_store)
+        self.profile_cache = ProfileCache()
+        self.stale_after_days = 30
+        self.analysis = None
+        self.selectors = SelectorRegistry()
+
+    def log(self, message, level=INFO):
+        """Queue a log line for the UI and the log file"""
+        self.log_pipeline.log(message, level)
+
+    def setup_driver(self):
+        self.driver = DRIVER_POOL.checkout(self._create_driver)
+        return self.driver is not None
+
+    def _create_driver(self):
+        """Launch a new Chrome session, returns None when Chrome can't be started"""
+        if SELENIUM_MISSING:
+            self.log(f"❌ Missing required packages: {SELENIUM_MISSING}. "
+                     "Please run: pip install selenium chromedriver-autoinstaller", ERROR)
+            return None
+        try:
+            self.log("🔧 Summoning the Chrome beast from its digital slumber...")
+            
+            chrome_path, chromedriver_path = BROWSER_LOCATOR.resolve(self.log)
+            if not chrome_path:
+                self.log("❌ Chrome has vanished into thin air! Please summon it by installing Google Chrome "
+                         "or Chromium, or point INSTA_CHROME_PATH at it.", ERROR)
+                return None
+            
+            # Set up Chrome options
+            options = Options()
+            options.binary_location = chrome_path
+            
+            if not self.dev_mode:
+                options.add_argument("--headless")
+            
+            # Essential Chrome arguments
+            profile = BROWSE_PROFILES[self.browse_profile]
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--disable-infobars")
+            options.add_argument("--disable-notifications")
+            options.add_argument(f"--window-size={profile['window_size']}")
+            
+            # Our own wait conditions decide when a page is usable, so get() needn't wait for every image
+            options.page_load_strategy = self.page_load_strategy or profile['page_load_strategy']
+            if profile['block_media']:
+                options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+            
+            # Network events in the performance log let the scraper read the list JSON the page loads
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+            
+            # Create WebDriver
+            self.log("🚀 Launching Chrome into the digital stratosphere...")
+            
+            started = time.perf_counter()
+            service = Service(executable_path=chromedriver_path) if chromedriver_path else Service()
+            driver = webdriver.Chrome(service=service, options=options)
+            METRICS.inc('instaunfollower_browsers_launched_total')
+            if profile['block_media']:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            
+            self.log(f"✅ Chrome has achieved liftoff in {time.perf_counter() - started:.2f}s! Houston, we have a browser!", SUCCESS)
+            return driver
+            
+        except Exception as e:
+            self.log(f"💥 Chrome decided to play dead: {str(e)}", ERROR)
+            # The cached paths may be what broke, so probe from scratch next time
+            BROWSER_LOCATOR.forget()
+            
+            # Troubleshooting help
+            self.log("📋 TROUBLESHOOTING:", WARNING)
+            self.log("1. Install/Update Google Chrome", WARNING)
+            self.log("2. Close all Chrome windows", WARNING)
+            self.log("3. Run as administrator", WARNING)
+            self.log("4. Disable antivirus temporarily", WARNING)
+            
+            return None
+
+    def _wait_step(self, step, condition, log=True, driver=None):
+        """Wait until the step's postcondition holds (or its budget runs out) and record how long it took"""
+        timeout, legacy_sleep = STEP_BUDGETS[step]
+        started = time.monotonic()
+        with TRACER.span(step) as span:
+            try:
+                result = WebDriverWait(driver or self.driver, timeout, poll_frequency=0.1).until(condition)
+            except TimeoutException:
+                result = False
+                span.set('timeout')
+                METRICS.inc('instaunfollower_wait_timeouts_total', step=step)
+
+        elapsed = time.monotonic() - started
+        with self.step_stats_lock:
+            stats = self.step_stats.setdefault(step, {'count': 0, 'waited': 0.0, 'legacy': 0.0, 'samples': []})
+            stats['count'] += 1
+            stats['waited'] += elapsed
+            stats['legacy'] += legacy_sleep
+            stats['samples'].append(elapsed)
+
+        if log:
+            if result is False:
+                self.log(f"⏱️ {step}: gave up after its {timeout}s budget (old fixed sleep: {legacy_sleep}s)", DEBUG)
+            else:
+                self.log(f"⏱️ {step}: ready in {elapsed:.2f}s (old fixed sleep: {legacy_sleep}s)", DEBUG)
+        return result
+
+    def _log_wait_savings(self):
+        """Summarize time spent waiting vs the fixed sleeps the same steps used to take"""
+        if not self.step_stats:
+            return
+        waited = sum(stats['waited'] for stats in self.step_stats.values())
+        legacy = sum(stats['legacy'] for stats in self.step_stats.values())
+        for step, stats in sorted(self.step_stats.items()):
+            self.log(
+                f"⏱️ {step}: {stats['count']}x, avg {stats['waited'] / stats['count']:.2f}s "
+                f"(old fixed sleep {stats['legacy'] / stats['count']:.1f}s)",
+                DEBUG
+            )
+        self.log(f"⏱️ Waited {waited:.1f}s in total instead of {legacy:.1f}s of fixed sleeps (saved {legacy - waited:.1f}s)", DEBUG)
+        self.step_stats = {}
+
+    def _visit(self, url, page, driver=None):
+        """Navigate to url, tallying bytes and timings of the page being left under its page kind
+
+        With the 'none' load strategy get() returns before the new document exists, so this also
+        waits for it to commit - otherwise the old page could satisfy the caller's next wait.
+        """
+        driver = driver or self.driver
+        previous = self._record_page(driver)
+        started = time.monotonic()
+        with TRACER.span(f"page.{page}", url=url):
+            driver.get(url)
+        blocked = time.monotonic() - started
+        METRICS.inc('instaunfollower_page_loads_total', page=page)
+        METRICS.observe('instaunfollower_page_load_seconds', blocked, page=page)
+        if previous is not None:
+            self._wait_step('page.commit', lambda d: d.execute_script("return performance.timeOrigin") != previous,
+                            log=False, driver=driver)
+        self.open_pages[id(driver)] = (page, blocked)
+
+    def _record_page(self, driver):
+        """Add the current page's transfer size and timings to page_stats, returns its timeOrigin"""
+        opened = self.open_pages.pop(id(driver), None)
+        try:
+            with TRACER.span('script.page_metrics'):
+                metrics = driver.execute_script(PAGE_METRICS_JS)
+        except WebDriverException:
+            return None
+        if opened is None or not metrics:
+            return metrics['origin'] if metrics else None
+        page, blocked = opened
+        with self.step_stats_lock:
+            stats = self.page_stats.setdefault(page, {'count': 0, 'bytes': 0, 'blocked': 0.0, 'dom_ready': 0.0})
+            stats['count'] += 1
+            stats['bytes'] += metrics['bytes'] or 0
+            stats['blocked'] += blocked
+            stats['dom_ready'] += (metrics['dom_ready'] or 0) / 1000.0
+        return metrics['origin']
+
+    def _log_page_stats(self):
+        """Summarize bytes and load times per page kind since the last summary"""
+        if self.driver:
+            self._record_page(self.driver)
+        if not self.page_stats:
+            return
+        total_bytes = sum(stats['bytes'] for stats in self.page_stats.values())
+        total_pages = sum(stats['count'] for stats in self.page_stats.values())
+        for page, stats in sorted(self.page_stats.items()):
+            self.log(
+                f"📦 {page}: {stats['count']}x, avg {stats['bytes'] / stats['count'] / 1024:.0f} KB, "
+                f"DOM ready in {stats['dom_ready'] / stats['count']:.2f}s, get() blocked {stats['blocked'] / stats['count']:.2f}s",
+                DEBUG
+            )
+        self.log(f"📦 Loaded {total_pages} pages, {total_bytes / (1024 * 1024):.1f} MB in total ({self.browse_profile} browsing profile)", DEBUG)
+        self.page_stats = {}
+
+    def _log_selector_stats(self):
+        """Persist selector hit stats and show which strategies are currently winning"""
+        for line in self.selectors.summary():
+            self.log(f"🧭 {line}", DEBUG)
+        self.selectors.save()
+
+    def submit(self, kind, **params):
+        """Queue a task behind whatever is running and return it so it can be cancelled"""
+        task = ScraperTask(kind, **params)
+        self.tasks.put(task)
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, name="scraper-worker", daemon=True)
+            self.thread.start()
+        return task
+    
+    def login(self, username, password):
+        return self.submit("login", username=username, password=password)
+    
+    def scrape_data(self):
+        return self.submit("scrape")
+    
+    def unfollow_users(self, users, resume=False):
+        return self.submit("unfollow", users=list(users), resume=resume)
+    
+    def cancel_all(self):
+        """Cancel the running task and everything still queued"""
+        while True:
+            try:
+                task = self.tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is not None:
+                task.cancel()
+                self.task_cancelled.emit(task.kind)
+        if self.current_task:
+            self.current_task.cancel()
+    
+    def shutdown(self, timeout=15):
+        """Cancel all work and stop the worker thread, giving the current step up to `timeout` seconds to finish"""
+        self.cancel_all()
+        if self.thread is not None and self.thread.is_alive():
+            self.tasks.put(None)
+            self.thread.join(timeout)
+        self.pipeline.shutdown(wait=False)
+    
+    def _cancel_event(self):
+        """Cancellation flag of the running task (a never-set one when called outside the worker loop)"""
+        return self.current_task.cancel_event if self.current_task else threading.Event()
+    
+    def _check_cancelled(self):
+        if self.current_task and self.current_task.cancelled:
+            raise TaskCancelled()
+    
+    def pending_unfollow_job(self):
+        """Return the interrupted unfollow job for this account, if there is one"""
+        return UnfollowJournal(self.username).unfinished_job()
+    
+    def run(self):
+        """Worker loop: run queued tasks one at a time until shutdown() posts the sentinel"""
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                return
+            if task.cancelled:
+                continue
+            
+            self.current_task = task
+            self.task_started.emit(task.kind)
+            try:
+                with TRACER.span(f"task.{task.kind}", username=task.params.get('username', self.username)):
+                    if task.kind == "login":
+                        self.username = task.params['username']
+                        self.password = task.params['password']
+                        self._perform_login()
+                    elif task.kind == "scrape":
+                        self._scrape_followers_following()
+                    elif task.kind == "unfollow":
+                        self.users_to_unfollow = task.params['users']
+                        self.resume_unfollow = task.params['resume']
+                        self._perform_unfollow()
+            except TaskCancelled:
+                pass
+            except Exception as e:
+                self.log(f"💥 Thread error: {str(e)}", ERROR)
+                self.task_failed.emit(task.kind, str(e))
+            finally:
+                self.current_task = None
+                self.progress.flush()
+                if task.cancelled:
+                    self.log(f"✋ {task.kind.capitalize()} cancelled", WARNING)
+                    self.task_cancelled.emit(task.kind)
+                else:
+                    self.task_finished.emit(task.kind)
+                self._log_wait_savings()
+                self._log_page_stats()
+                self._log_selector_stats()
+                self._recycle_driver_if_needed()
+
+    def _recycle_driver_if_needed(self):
+        """Swap a browser that has served too many tasks or grown too big for a fresh one"""
+        if not self.driver or not DRIVER_POOL.task_done(self.driver):
+            return
+        self.log("♻️ Browser has done its shift - swapping in a fresh one")
+        METRICS.inc('instaunfollower_driver_restarts_total', reason='worn_out')
+        logged_in = self.session_store.has(self.username)
+        if logged_in:
+            self.save_session()
+        DRIVER_POOL.discard(self.driver)
+        self.driver = DRIVER_POOL.checkout(self._create_driver)
+        if self.driver and logged_in:
+            self._restore_session()
+    
+    def _perform_login(self):
+        try:
+            if not self.setup_driver():
+                self.login_result.emit(False, "Failed to setup browser")
+                return
+            self._check_cancelled()
+            
+            if self._restore_session():
+                self.log("✅ Saved session still valid - skipped the login form entirely!", SUCCESS)
+                self.login_result.emit(True, "Login successful!")
+                return
+            
+            if not self.password:
+                self.login_result.emit(False, "Saved session expired - please enter your password")
+                return
+            
+            self.log("🌐 Setting sail for the Instagram islands...")
+            self._visit(f"{self.base_url}/accounts/login/", 'login')
+            self._check_cancelled()
+            
+            self.log("⏳ Twiddling thumbs while Instagram decides to cooperate...")
+            # The form is only safe to type into once React has finished hydrating it
+            self._wait_step('login.page_ready', EC.all_of(
+                EC.presence_of_element_located((By.TAG_NAME, "input")),
+                dom_quiet(300)
+            ))
+            self._check_cancelled()
+            
+            # All known selector strategies are raced at once, last login's winner first
+            self.log("🔍 Playing hide and seek with the login fields...")
+            username_field, selector = self.selectors.find(self.driver, 'login.username', 5, self.log)
+            if username_field:
+                self.log(f"✅ Found username field using: {selector}", SUCCESS)
+            password_field, selector = self.selectors.find(self.driver, 'login.password', 2, self.log)
+            if password_field:
+                self.log(f"✅ Found password field using: {selector}", SUCCESS)
+            
+            if not username_field or not password_field:
+                self.log("❌ Could not locate login fields with any strategy", ERROR)
+                self.login_result.emit(False, "Instagram updated their login page - couldn't find login fields")
+                return
+            self._check_cancelled()
+            
+            # Enter credentials
+            self.log("⌨️ Whispering sweet credentials to Instagram...")
+            username_field.clear()
+            username_field.send_keys(self.username)
+            self._wait_step('login.username_typed', lambda d: username_field.get_attribute('value') == self.username)
+            
+            password_field.clear()
+            password_field.send_keys(self.password)
+            self._wait_step('login.password_typed', lambda d: password_field.get_attribute('value') == self.password)
+            
+            # Last chance to back out before the credentials go to Instagram
+            self._check_cancelled()
+            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+            login_button.click()
+            
+            self.log("🔐 Knocking on Instagram's door... please don't call security!")
+            # Done as soon as we leave the login page or Instagram shows an error on it
+            self._wait_step('login.submitted', EC.any_of(
+                lambda d: "login" not in d.current_url,
+                EC.presence_of_element_located((By.XPATH, "//*[@id='slfErrorAlert' or @role='alert']"))
+            ))
+            
+            # Check login result
+            current_url = self.driver.current_url
+            if current_url.startswith(self.base_url) and "login" not in current_url:
+                self.log("✅ We're in! Instagram rolled out the red carpet!", SUCCESS)
+                self.save_session()
+                self.login_result.emit(True, "Login successful!")
+            else:
+                self.login_result.emit(False, "Instagram gave us the cold shoulder - check your credentials!")
+                
+        except TaskCancelled:
+            raise
+        except Exception as e:
+            self.login_result.emit(False, f"Login error: {str(e)}")
+    
+    def _restore_session(self):
+        """Restore saved cookies/local storage and check they still log us in"""
+        session = self.session_store.load(self.username)
+        if not session:
+            return False
+        
+        self.log("🍪 Found a saved session - dusting off the old cookies...")
+        try:
+            # Cookies can only be set for the domain currently loaded, robots.txt is the cheapest page there
+            self._visit(f"{self.base_url}/robots.txt", 'robots')
+            for cookie in session.get('cookies', []):
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException:
+                    continue
+            self.driver.execute_script(
+                "for (const [key, value] of Object.entries(arguments[0])) { localStorage.setItem(key, value); }",
+                session.get('local_storage', {})
+            )
+            
+            # Settings redirects straight to the login page when the session is dead
+            self._visit(f"{self.base_url}/accounts/edit/", 'settings')
+            self._wait_step('login.session_check', lambda d: d.execute_script("return document.readyState") == 'complete')
+            if "login" not in self.driver.current_url:
+                self.save_session()
+                return True
+        except Exception as e:
+            self.log(f"⚠️ Couldn't restore saved session: {str(e)}", WARNING)
+        
+        self.log("⌛ Saved session has expired - falling back to the login form", WARNING)
+        self.session_store.delete(self.username)
+        self.driver.delete_all_cookies()
+        return False
+    
+    def save_session(self):
+        """Persist the current session's cookies and local storage for the next launch"""
+        if not self.driver or not self.username:
+            return
+        try:
+            cookies = self.driver.get_cookies()
+            local_storage = self.driver.execute_script(
+                "const items = {}; for (let i = 0; i < localStorage.length; i++) { const key = localStorage.key(i); items[key] = localStorage.getItem(key); } return items;"
+            )
+            self.session_store.save(self.username, cookies, local_storage or {})
+        except Exception as e:
+            self.log(f"⚠️ Couldn't save session: {str(e)}", WARNING)
+    
+    def forget_session(self):
+        """Drop the saved session so the next launch logs in from scratch"""
+        if self.username:
+            self.session_store.delete(self.username)
+    
+    def _scrape_followers_following(self):
+        try:
+            if not self.driver:
+                self.log("❌ No browser session", ERROR)
+                self._scrape_failed("No browser session")
+                return
+            
+            counts = self._open_own_profile()
+            if counts['followers'] is not None and counts['following'] is not None:
+                self.log(f"📈 You're ruling over {counts['followers']} followers while stalking {counts['following']} accounts!")
+
+            # Harvest both lists, incrementally on top of the last snapshot when there is one
+            stored = []
+            for kind in ('followers', 'following'):
+                self.log(f"👥 Investigating your {kind} list like a digital detective...")
+                try:
+                    usernames, previous = self._scrape_list(kind, counts[kind])
+                except TaskCancelled:
+                    raise
+                except Exception as e:
+                    self.log(f"⚠️ Instagram is being secretive about your {kind} list: {str(e)}", WARNING)
+                    self._scrape_failed(f"Couldn't read the {kind} list: {e}")
+                    return
+                setattr(self, kind, usernames)
+                # Snapshot bookkeeping runs on the pipeline thread while the browser moves on
+                stored.append(self.pipeline.submit(self._store_snapshot, kind, usernames, counts[kind], previous))
+            for future in stored:
+                future.result()
+
+            # Ranked longest-followed first, from the snapshot history that was just extended
+            self.analysis = self.follow_graph.report(self.username, self.stale_after_days)
+            if self.analysis:
+                non_followers = self.analysis['non_followers']
+            else:
+                non_followers = sorted(self.following - self.followers)
+
+            self.log(f"✅ Elementary, Watson! Discovered {len(non_followers)} potential backstabbers!", SUCCESS)
+            if self.analysis:
+                self.log(f"🤝 {self.analysis['mutuals']} mutuals, {len(self.analysis['stale'])} followed for {self.stale_after_days}+ days "
+                         f"without a follow-back, {len(self.analysis['lost_followers'])} followers lost recently")
+            cached = self.profile_cache.get_many(non_followers)
+            known = [cached[username] for username in non_followers if username in cached]
+            if known:
+                verified = sum(bool(profile['verified']) for profile in known)
+                private = sum(bool(profile['private']) for profile in known)
+                self.log(f"🔎 Of those, {verified} are verified and {private} are private accounts")
+            self.scraping_complete.emit(non_followers)
+
+        except TaskCancelled:
+            raise
+        except Exception as e:
+            self.log(f"💥 Scraping error: {str(e)}", ERROR)
+            self._scrape_failed(str(e))
+
+    def _scrape_failed(self, reason):
+        # The empty list resets the UI; task_failed tells callers it isn't a real "nobody to unfollow"
+        self.task_failed.emit('scrape', reason)
+        self.scraping_complete.emit([])
+
+    def _open_own_profile(self):
+        """Load our profile page and return its {'followers', 'following'} counts (None when unreadable)"""
+        self.log("📱 Strutting over to your fabulous profile...")
+        self._visit(f"{self.base_url}/{self.username}/", 'own_profile')
+        self._wait_step('scrape.profile_ready', document_ready((By.XPATH, f"//a[contains(@href, '/{self.username}/following/')]")))
+        
+        # Get followers count and following count from profile page
+        self.log("📊 Counting your digital minions...")
+        counts = {'followers': None, 'following': None}
+        try:
+            for kind in counts:
+                count_elements = self.driver.find_elements(By.XPATH, f"//a[contains(@href, '/{kind}/')]//span")
+                for elem in count_elements:
+                    # The title attribute holds the exact number when the label is abbreviated (12.5K)
+                    count = self._parse_count(elem.get_attribute('title') or elem.text)
+                    if count is not None:
+                        counts[kind] = count
+                        break
+        except Exception as e:
+            self.log(f"⚠️ Could not get exact counts: {str(e)}", WARNING)
+        return counts
+
+    def _scrape_list(self, kind, expected_count):
+        """Scrape one list, reusing the last snapshot when only new rows were added since"""
+        previous = self.snapshot_store.latest(self.username, kind)
+        started = time.monotonic()
+        with TRACER.span(f"scrape.harvest_{kind}", incremental=previous is not None) as span:
+            harvested, stopped_early = self._harvest_list(kind, expected_count, previous)
+            span.set(rows=len(harvested), stopped_early=stopped_early)
+        elapsed = time.monotonic() - started
+        METRICS.inc('instaunfollower_rows_scraped_total', len(harvested), kind=kind)
+        if elapsed > 0:
+            METRICS.set('instaunfollower_scrape_rows_per_second', len(harvested) / elapsed, kind=kind)
+
+        if stopped_early:
+            added = harvested - previous['usernames']
+            # Past the known run the list is unchanged, unless someone dropped off - the count tells us
+            if expected_count is not None and previous['profile_count'] is not None \
+                    and expected_count - previous['profile_count'] == len(added):
+                self.log(f"⚡ Caught up with the last snapshot after {len(harvested)} rows - skipping the rest of the {kind} list")
+                usernames = previous['usernames'] | harvested
+            else:
+                self.log(f"🔁 The {kind} count doesn't add up since the last snapshot - someone left, doing a full pass", WARNING)
+                usernames, _ = self._harvest_list(kind, expected_count, None)
+        else:
+            usernames = harvested
+
+        if expected_count is not None and len(usernames) < expected_count:
+            self.log(f"⚠️ Only {len(usernames)}/{expected_count} {kind} rendered - Instagram stopped handing out rows", WARNING)
+        else:
+            self.log(f"✅ Collected all {len(usernames)} {kind}!", SUCCESS)
+        return usernames, previous
+
+    def _store_snapshot(self, kind, usernames, expected_count, previous):
+        """Save a harvested list as a snapshot and log what changed since the previous one"""
+        snapshot_id = self.snapshot_store.save(self.username, kind, usernames, expected_count)
+        # The list rows carry privacy/verified badges; the following list also tells us who we follow
+        updates = {}
+        for username in usernames:
+            profile = self.profiles.get(username, {})
+            fields = {'exists': True}
+            # Only the network feed knows about privacy, DOM rows just default it to False
+            if profile.get('pk') is not None:
+                fields['private'] = profile['is_private']
+            for field, key in (('verified', 'is_verified'), ('full_name', 'full_name')):
+                if key in profile:
+                    fields[field] = profile[key]
+            if kind == 'following':
+                fields['follow_state'] = 'following'
+            updates[username] = fields
+        self.profile_cache.put_many(updates)
+        if previous:
+            added, removed = self.snapshot_store.diff(previous['id'], snapshot_id)
+            self.log(f"📊 {kind.capitalize()} since last snapshot: +{len(added)} / -{len(removed)}")
+            if kind == 'followers' and removed:
+                self.log(f"💔 Lost followers: {', '.join('@' + username for username in removed[:20])}{' ...' if len(removed) > 20 else ''}", WARNING)
+
+    def _harvest_list(self, kind, expected_count, previous):
+        """Harvest a dialog, stopping early on a run of usernames already in the previous snapshot"""
+        harvested = set()
+        known_run = 0
+        self.progress.start('scrape', kind, expected_count or 0)
+        harvest = self._harvest_dialog(kind, expected_count)
+        for batch in harvest:
+            if self.current_task and self.current_task.cancelled:
+                harvest.close()
+                raise TaskCancelled()
+            harvested.update(batch)
+            total = expected_count if expected_count is not None else '?'
+            self.log(f"📝 Harvested {len(harvested)}/{total} {kind} like a digital farmer...")
+            self.progress.update(len(harvested))
+
+            if previous is not None:
+                for username in batch:
+                    known_run = known_run + 1 if username in previous['usernames'] else 0
+                if known_run >= KNOWN_RUN_TO_STOP:
+                    # Closing the generator runs its finally block, which closes the dialog
+                    harvest.close()
+                    return harvested, True
+        return harvested, False
+
+    def _parse_count(self, text):
+        """Turn profile count labels like '1,234', '12.5K' or '1.2M' into an int"""
+        if not text:
+            return None
+        text = text.strip().replace(',', '').replace(' ', '').upper()
+        multiplier = 1
+        if text.endswith('K'):
+            multiplier, text = 1000, text[:-1]
+        elif text.endswith('M'):
+            multiplier, text = 1000000, text[:-1]
+        try:
+            return int(float(text) * multiplier)
+        except ValueError:
+            return None
+
+    def _harvest_dialog(self, kind, expected_count=None):
+        """Open the followers/following dialog and yield usernames in batches as rows render"""
+        dialog_link = WebDriverWait(self.driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, f"//a[contains(@href, '/{self.username}/{kind}/')]"))
+        )
+        # Start listening before the click so the first page of the list isn't missed
+        feed = FriendshipFeed(self.driver, kind) if self.extraction_mode == 'network' else None
+        dialog_link.click()
+
+        dialog = WebDriverWait(self.driver, 10).until(
+            EC.presence_of_element_located((By.XPATH, "//div[@role='dialog']"))
+        )
+        row_locator = (By.CSS_SELECTOR, "a[href]")
+        self._wait_step('scrape.dialog_open', element_count_above(dialog, row_locator, 0))
+        with TRACER.span('script.find_scroll_box'):
+            scroll_box = self.driver.execute_script(FIND_SCROLL_BOX_JS, dialog)
+
+        seen = set()
+        skip = sorted(RESERVED_PATHS | {self.username})
+        processed = 0
+        stale_scrolls = 0
+        from_network = False
+
+        try:
+            while True:
+                batch = []
+                if feed and feed.collect():
+                    # One parsed payload per page of rows instead of a WebDriver call per row
+                    if not from_network:
+                        self.log(f"📡 Reading the {kind} list straight from Instagram's own responses")
+                    from_network = True
+                    for user in feed.take():
+                        username = user.get('username')
+                        if username and username != self.username and username not in seen:
+                            seen.add(username)
+                            batch.append(username)
+                            self.profiles[username] = {
+                                'pk': user.get('pk'),
+                                'full_name': user.get('full_name', ''),
+                                'is_private': bool(user.get('is_private')),
+                                'is_verified': bool(user.get('is_verified')),
+                            }
+                elif not from_network:
+                    # Rows only ever get appended, so only serialize anchors we haven't processed yet
+                    with TRACER.span('script.extract_rows', kind=kind) as span:
+                        extracted = self.driver.execute_script(EXTRACT_ROWS_JS, dialog, processed, skip)
+                        span.set(rows=len(extracted['rows']))
+                    for row in extracted['rows']:
+                        username = row['username']
+                        if username not in seen:
+                            seen.add(username)
+                            batch.append(username)
+                            profile = self.profiles.setdefault(username, {'pk': None, 'is_private': False})
+                            profile.update(full_name=row['full_name'], is_verified=row['verified'], button=row['button'])
+                    processed = extracted['total']
+
+                if batch:
+                    stale_scrolls = 0
+                    yield batch
+                else:
+                    stale_scrolls += 1
+
+                if expected_count is not None and len(seen) >= expected_count:
+                    break
+                if stale_scrolls >= MAX_STALE_SCROLLS:
+                    break
+                if from_network and feed.finished and not feed.pending:
+                    break
+
+                # Scroll the list container to the bottom so the next page of rows loads
+                self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", scroll_box)
+                if from_network:
+                    self._wait_step('scrape.rows_loaded', lambda d: feed.collect() or feed.finished, log=False)
+                else:
+                    self._wait_step('scrape.rows_loaded', element_count_above(dialog, row_locator, processed), log=False)
+        finally:
+            self._close_dialog(dialog)
+
+    def _close_dialog(self, dialog):
+        """Close the followers/following modal"""
+        try:
+            close_btn = self.driver.find_element(By.XPATH, "//div[@role='dialog']//button[contains(@aria-label, 'Close')] | //*[name()='svg' and @aria-label='Close']/ancestor::*[@role='button' or self::button][1]")
+            close_btn.click()
+        except Exception:
+            from selenium.webdriver.common.keys import Keys
+            self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
+        self._wait_step('scrape.dialog_closed', EC.staleness_of(dialog))
+    
+    def load_coordinates(self):
+        """Load saved unfollow button coordinates"""
+        try:
+            if os.path.exists(self.coords_file):
+                with open(self.coords_file, 'r') as f:
+                    coords = json.load(f)
+                    self.unfollow_coords = coords
+                    return True
+        except:
+            pass
+        return False
+    
+    def save_coordinates(self, x, y):
+        """Save unfollow button coordinates"""
+        try:
+            coords = {'x': x, 'y': y}
+            with open(self.coords_file, 'w') as f:
+                json.dump(coords, f)
+            self.unfollow_coords = coords
+            self.log(f"💾 Coordinates saved: ({x}, {y})")
+        except Exception as e:
+            self.log(f"❌ Failed to save coordinates: {str(e)}", ERROR)
+    
+    def _pyautogui(self):
+        """Import pyautogui on first use - it needs a display server, which headless runs don't have"""
+        import pyautogui
+        return pyautogui
+    
+    def _use_pyautogui_unfollow(self, username):
+        """Use PyAutoGUI to click unfollow button using saved coordinates"""
+        try:
+            pyautogui = self._pyautogui()
+            if not self.unfollow_coords:
+                self.log(f"📍 No coordinates saved for @{username}. Manual coordinate detection needed.")
+                return self._detect_and_save_coordinates(username)
+            
+            x, y = self.unfollow_coords['x'], self.unfollow_coords['y']
+            self.log(f"🎯 Using saved coordinates ({x}, {y}) to unfollow @{username}")
+            
+            # Click at saved coordinates
+            with TRACER.span('pyautogui.click', username=username):
+                pyautogui.click(x, y)
+                time.sleep(2)
+            
+            # Try to find and click unfollow confirmation
+            # Look for unfollow confirmation button around the area
+            unfollow_found = False
+            with TRACER.span('pyautogui.confirm', username=username):
+                for offset_x in range(-50, 51, 25):
+                    for offset_y in range(50, 151, 25):  # Look below the button
+                        try:
+                            # Click in the general area where confirmation appears
+                            pyautogui.click(x + offset_x, y + offset_y)
+                            time.sleep(1)
+                            unfollow_found = True
+                            self.log(f"✅ PyAutoGUI clicked confirmation at ({x + offset_x}, {y + offset_y})", SUCCESS)
+                            break
+                        except:
+                            continue
+                    if unfollow_found:
+                        break
+            
+            if unfollow_found:
+                self.log(f"✅ PyAutoGUI successfully unfollowed @{username}", SUCCESS)
+                return True
+            else:
+                self.log(f"❌ PyAutoGUI couldn't find unfollow confirmation for @{username}", ERROR)
+                return False
+                
+        except Exception as e:
+            self.log(f"💥 PyAutoGUI error for @{username}: {str(e)}", ERROR)
+            return False
+    
+    def _detect_and_save_coordinates(self, username):
+        """Guide user to detect and save unfollow button coordinates"""
+        try:
+            pyautogui = self._pyautogui()
+            self.log(f"📍 COORDINATE DETECTION MODE for @{username}")
+            self.log(f"🎯 INSTRUCTIONS:")
+            self.log(f"1. Look at the Instagram page for @{username}")
+            self.log(f"2. Find the 'Following' button")
+            self.log(f"3. Move your mouse over it but DON'T click yet")
+            self.log(f"4. Wait 5 seconds for coordinate detection...")
+            
+            # Wait 5 seconds for user to position mouse
+            with TRACER.span('pyautogui.detect', username=username):
+                time.sleep(5)
+            
+            # Get current mouse position
+            x, y = pyautogui.position()
+            self.log(f"📍 Detected coordinates: ({x}, {y})")
+            
+            # Save coordinates
+            self.save_coordinates(x, y)
+            
+            # Now try to click
+            self.log(f"🎯 Attempting click at detected coordinates...")
+            with TRACER.span('pyautogui.click', username=username):
+                pyautogui.click(x, y)
+                time.sleep(2)
+            
+            # Look for unfollow confirmation button
+            self.log(f"🔍 Looking for unfollow confirmation button...")
+            confirmation_found = False
+            
+            # Try clicking below the original button (where confirmation usually appears)
+            with TRACER.span('pyautogui.confirm', username=username):
+                for offset_y in [30, 50, 70, 90]:
+                    try:
+                        pyautogui.click(x, y + offset_y)
+                        time.sleep(1)
+                        confirmation_found = True
+                        self.log(f"✅ Clicked confirmation at ({x}, {y + offset_y})", SUCCESS)
+                        break
+                    except:
+                        continue
+            
+            if confirmation_found:
+                self.log(f"🎉 Successfully unfollowed @{username} using coordinate detection!", SUCCESS)
+                return True
+            else:
+                self.log(f"⚠️ Coordinates saved but confirmation click failed for @{username}", WARNING)
+                return False
+                
+        except Exception as e:
+            self.log(f"💥 Coordinate detection failed for @{username}: {str(e)}", ERROR)
+            return False
+    
+    def _perform_unfollow(self):
+        try:
+            if not self.driver:
+                self.log("❌ No browser session", ERROR)
+                self.unfollow_complete.emit("Failed: No browser session")
+                return
+            
+            if not self.users_to_unfollow:
+                self.log("❌ No users selected for unfollowing", ERROR)
+                self.unfollow_complete.emit("No users selected")
+                return
+            
+            # Every user goes through the journal so an interrupted run can pick up where it stopped
+            self.journal = UnfollowJournal(self.username)
+            states = self.journal.resume_job() if self.resume_unfollow else None
+            if states is None:
+                self.journal.start_job(self.users_to_unfollow)
+                states = {}
+            else:
+                confirmed = {user for user in self.users_to_unfollow if states.get(user, ('pending', ''))[0] == 'confirmed'}
+                self.users_to_unfollow = [user for user in self.users_to_unfollow if user not in confirmed]
+                self.log(f"📒 Resuming the interrupted job - skipping {len(confirmed)} accounts already confirmed")
+            
+            # Accounts we no longer follow need no action, so drop them before paying for a profile visit
+            # (the dialog mode walks the following list anyway and finds out on the way)
+            if self.unfollow_mode != 'dialog':
+                still_following = self._precheck_follow_state(self.users_to_unfollow)
+                for user in set(self.users_to_unfollow) - set(still_following):
+                    self.journal.record(user, 'confirmed', 'not_following')
+                self.users_to_unfollow = still_following
+            
+            total_users = len(self.users_to_unfollow)
+            self.progress.start('unfollow', self.unfollow_mode, total_users)
+            self.pacing = PacingScheduler(self.username, self.unfollow_interval, 60.0 / self.actions_per_minute,
+                                          self.hourly_budget, self.daily_budget)
+            
+            self.log(f"🎯 Time for the great digital cleanse! Saying goodbye to {total_users} accounts...")
+            self.log(f"⏳ At the current pace that takes about {format_duration(self.pacing.eta(total_users, self.unfollow_workers))} "
+                     f"(budget: {self.hourly_budget}/hour, {self.daily_budget}/day)")
+            
+            if self.unfollow_mode == 'dialog':
+                unfollowed_count, completed = self._perform_dialog_unfollow()
+            elif self.unfollow_workers > 1 and total_users > 1:
+                unfollowed_count, completed = self._perform_parallel_unfollow()
+            else:
+                unfollowed_count, completed = self._perform_sequential_unfollow()
+            
+            if completed:
+                self.journal.finish_job()
+            else:
+                self.journal.close()
+                self.log("📒 Job interrupted - it's saved in the journal and can be resumed on the next login", WARNING)
+            
+            if self._cancel_event().is_set():
+                completion_msg = f"✋ Unfollow run cancelled after {unfollowed_count}/{total_users} accounts - the rest can be resumed later"
+            else:
+                completion_msg = f"✅ Mission accomplished! {unfollowed_count}/{total_users} accounts have been digitally ghosted!"
+            self.log(completion_msg, WARNING if self._cancel_event().is_set() else SUCCESS)
+            self.unfollow_complete.emit(completion_msg)
+            
+        except Exception as e:
+            if self.journal:
+                self.journal.close()
+            error_msg = f"💥 The great unfollow mission hit a brick wall: {str(e)}"
+            self.log(error_msg, ERROR)
+            self.unfollow_complete.emit(error_msg)
+    
+    def _precheck_follow_state(self, users):
+        """Return the queued users we still follow, judged from a fresh snapshot or one pass over the following list"""
+        latest = self.snapshot_store.latest(self.username, 'following')
+        if latest and time.time() - latest['taken_at'] <= PRECHECK_MAX_AGE:
+            following = latest['usernames']
+            source = f"the {format_duration(time.time() - latest['taken_at'])} old snapshot"
+        else:
+            following = self._following_containing(set(users))
+            source = "your following list"
+            if following is None:
+                self.log("🔎 Couldn't read the whole following list - visiting every profile to be safe", WARNING)
+                return list(users)
+        
+        kept = [user for user in users if user in following]
+        self.profile_cache.put_many({user: {'follow_state': 'following' if user in following else 'not_following'}
+                                     for user in users})
+        if len(kept) < len(users):
+            self.log(f"⏭️ Skipping {len(users) - len(kept)} accounts that {source} shows you no longer follow "
+                     "(already unfollowed, deactivated or deleted)")
+        return kept
+    
+    def _following_containing(self, targets):
+        """Walk the following dialog until every target is seen, returns the usernames seen or None if unsure"""
+        expected_count = self._open_own_profile()['following']
+        self.log(f"🔎 Checking which of the {len(targets)} queued accounts you still follow...")
+        seen = set()
+        harvest = self._harvest_dialog('following', expected_count)
+        for batch in harvest:
+            seen.update(batch)
+            if targets <= seen:
+                # Everyone is still followed - no need to read the rest
+                harvest.close()
+                return seen
+        # Absence only means something when the whole list rendered - deleted accounts still count
+        # towards the profile number but never render, so the missing targets may make up the gap
+        if expected_count is None or len(seen) + len(targets - seen) < expected_count:
+            return None
+        return seen
+    
+    def _perform_sequential_unfollow(self):
+        """Unfollow users one by one on the main session, with the PyAutoGUI fallback"""
+        # Load saved coordinates if available
+        coords_loaded = self.load_coordinates()
+        if coords_loaded:
+            self.log(f"📍 Loaded saved coordinates: ({self.unfollow_coords['x']}, {self.unfollow_coords['y']})")
+        else:
+            self.log("📍 No saved coordinates found - will use coordinate detection on first user")
+        
+        unfollowed_count = 0
+        total_users = len(self.users_to_unfollow)
+        pending = collections.deque(self.users_to_unfollow)
+        stop_event = self._cancel_event()
+        
+        while pending:
+            username = pending.popleft()
+            if not self._wait_for_slot(stop_event, len(pending) + 1):
+                return unfollowed_count, False
+            try:
+                self._check_cancelled()
+                self.log(f"👤 Investigating @{username} ({total_users - len(pending)}/{total_users})... preparing digital ghosting protocol!")
+                
+                self.journal.record(username, 'attempted')
+                started = time.monotonic()
+                status, reason = self._unfollow_on_page(self.driver, username)
+                self.pacing.record(status, time.monotonic() - started)
+                unfollow_success = status == 'confirmed'
+                
+                if status == 'blocked':
+                    self.journal.record(username, 'failed', reason)
+                    self.log("🛑 Instagram is blocking our actions - backing off before trying again", ERROR)
+                    pending.appendleft(username)
+                    continue
+                
+                if status == 'gone':
+                    # Nothing left to unfollow, so there's nothing to retry either
+                    self.journal.record(username, 'confirmed', 'account_gone')
+                    continue
+                
+                if unfollow_success:
+                    unfollowed_count += 1
+                elif reason != 'navigation' and self.pyautogui_fallback:
+                    # Strategy 2: PyAutoGUI fallback if selenium failed
+                    self.log(f"🎯 Selenium failed, activating PyAutoGUI fallback for @{username}...", WARNING)
+                    success = self._use_pyautogui_unfollow(username)
+                    if success:
+                        unfollowed_count += 1
+                        unfollow_success = True
+                        reason = 'pyautogui'
+                
+                self.journal.record(username, 'confirmed' if unfollow_success else 'failed', reason)
+                
+                if not unfollow_success and reason != 'navigation':
+                    # Explain the failure from what the visit already cached instead of scanning the page again
+                    profile = self.profile_cache.get(username) or {}
+                    if profile.get('verified'):
+                        self.log(f"🔵 @{username} is verified royalty - Instagram is protecting them!", WARNING)
+                    elif profile.get('business'):
+                        self.log(f"🏢 @{username} runs a business empire - they've got anti-unfollow armor!", WARNING)
+                    elif profile:
+                        self.log(f"🛡️ @{username} has activated maximum stealth mode - unfollow button went into witness protection!", WARNING)
+                    else:
+                        self.log(f"🤷‍♂️ @{username} is a mystery wrapped in an enigma - can't figure out why unfollow failed!", WARNING)
+                
+            except TaskCancelled:
+                # Left as 'attempted' in the journal, so a resume picks it up again
+                return unfollowed_count, False
+            except Exception as e:
+                error_msg = str(e)
+                if "timeout" in error_msg.lower():
+                    self.log(f"⏰ @{username} took too long to respond - Instagram is being slow!", WARNING)
+                elif "element not found" in error_msg.lower():
+                    self.log(f"🕵️ @{username}'s page layout is different - they're using new Instagram features!", WARNING)
+                elif "clickable" in error_msg.lower():
+                    self.log(f"📱 @{username}'s buttons are unresponsive - mobile layout confusion!", WARNING)
+                else:
+                    self.log(f"🤖 @{username} caused a digital anomaly: {error_msg[:50]}...", WARNING)
+                self.journal.record(username, 'failed', error_msg[:100])
+                continue
+        
+        return unfollowed_count, True
+    
+    def _perform_dialog_unfollow(self):
+        """Unfollow from the rows of the following dialog - one list walk instead of a page load per user"""
+        targets = set(self.users_to_unfollow)
+        handled = set()
+        seen = set()
+        unfollowed_count = 0
+        stop_event = self._cancel_event()
+        
+        expected_count = self._open_own_profile()['following']
+        self.log("📜 Unfollowing straight from your following list - no profile visits needed")
+        harvest = self._harvest_dialog('following', expected_count)
+        try:
+            for batch in harvest:
+                seen.update(batch)
+                for username in batch:
+                    if username not in targets or username in handled:
+                        continue
+                    if not self._wait_for_slot(stop_event, len(targets) - len(handled)):
+                        return unfollowed_count, False
+                    
+                    self.log(f"👤 Found @{username} in the list ({len(handled) + 1}/{len(targets)})... preparing digital ghosting protocol!")
+                    self.journal.record(username, 'attempted')
+                    started = time.monotonic()
+                    try:
+                        status, reason = self._unfollow_in_dialog(username)
+                    except Exception as e:
+                        self.log(f"🤖 @{username} caused a digital anomaly: {str(e)[:50]}...", WARNING)
+                        status, reason = 'failed', str(e)[:100]
+                    self.pacing.record(status, time.monotonic() - started)
+                    
+                    if status == 'blocked':
+                        # Sitting out a long backoff with the dialog open isn't worth it - resume later instead
+                        self.journal.record(username, 'failed', reason)
+                        self.log("🛑 Instagram is blocking our actions - stopping here, the job can be resumed later", ERROR)
+                        return unfollowed_count, False
+                    
+                    handled.add(username)
+                    self.journal.record(username, 'confirmed' if status == 'confirmed' else 'failed', reason)
+                    if status == 'confirmed' and reason != 'not_following':
+                        unfollowed_count += 1
+                
+                if targets <= handled:
+                    break
+        finally:
+            # Runs the generator's cleanup, which closes the dialog
+            harvest.close()
+        
+        missing = targets - seen
+        if missing:
+            # Same reasoning as the pre-check: only a complete list proves we don't follow them any more
+            complete = expected_count is not None and len(seen) + len(missing) >= expected_count
+            for username in missing:
+                self.journal.record(username, 'confirmed' if complete else 'failed', 'not_following' if complete else 'not_in_list')
+            if complete:
+                self.log(f"⏭️ {len(missing)} accounts weren't in your following list - nothing left to unfollow there")
+            else:
+                self.log(f"⚠️ {len(missing)} accounts never showed up before the list stopped loading", WARNING)
+        return unfollowed_count, True
+    
+    def _unfollow_in_dialog(self, username):
+        """Unfollow one account through its row in the open following dialog, returns (status, reason)"""
+        METRICS.inc('instaunfollower_unfollow_attempts_total', mode='dialog')
+        started = time.monotonic()
+        with TRACER.span('unfollow.dialog_row', username=username) as span:
+            status, reason = self._unfollow_row(username)
+            span.set(status, reason=reason)
+        if status == 'confirmed':
+            self.profile_cache.put(username, follow_state='not_following')
+        elapsed = time.monotonic() - started
+        METRICS.inc('instaunfollower_unfollows_total', status=status, reason=reason or 'none')
+        METRICS.observe('instaunfollower_unfollow_seconds', elapsed, mode='dialog')
+        self._report_unfollow(username, status, elapsed)
+        return status, reason
+    
+    def _unfollow_row(self, username):
+        with TRACER.span('script.row_button'):
+            button = self.driver.execute_script(ROW_BUTTON_JS, username)
+        if button is None:
+            return 'failed', 'no_row'
+        if button.text.strip() not in ('Following', 'Requested'):
+            return 'confirmed', 'not_following'
+        
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+        button.click()
+        unfollow_confirm, _ = self.selectors.find(self.driver, 'unfollow.confirm_button', 2, self.log, clickable=True)
+        if unfollow_confirm is None:
+            self.log(f"🙄 @{username}'s unfollow confirmation button is playing hide and seek!", WARNING)
+            # Escape would close the list too, so back out through the modal's own Cancel
+            for cancel in self.driver.find_elements(By.XPATH, "//div[@role='dialog']//button[contains(., 'Cancel')]"):
+                cancel.click()
+            return 'failed', 'no_confirm'
+        
+        unfollow_confirm.click()
+        # The row's button flips to Follow once Instagram accepts the unfollow
+        flipped = self._wait_step('unfollow.verified', lambda d: button.text.strip() not in ('Following', 'Requested'))
+        if self._page_state(self.driver)['blocked']:
+            self.log(f"🛑 Instagram answered @{username}'s unfollow with an action block!", ERROR)
+            return 'blocked', 'action_block'
+        if flipped:
+            self.log(f"🎉 @{username} has been successfully yeeted into the digital void!", SUCCESS)
+            return 'confirmed', ''
+        self.log(f"😤 @{username} is still lurking in your following list - Instagram might be protecting them!", WARNING)
+        return 'failed', 'still_following'
+    
+    def _wait_for_slot(self, stop_event, remaining, workers=1):
+        """Wait for the pacing scheduler's next slot, False when the run should stop instead"""
+        self.progress.update(eta=self.pacing.eta(remaining, workers))
+        METRICS.set('instaunfollower_unfollow_queue_remaining', remaining)
+        while True:
+            if stop_event.is_set():
+                return False
+            delay, reason, slot = self.pacing.reserve(PACING_MAX_WAIT)
+            if delay is None:
+                self.log(f"🛑 The {reason} won't allow another unfollow within the hour - the job is saved and "
+                         "can be resumed later", WARNING)
+                return False
+            
+            if delay >= 1:
+                if reason == 'pace':
+                    self.log(f"☕ Taking a {delay:.1f}s coffee break to avoid Instagram's watchful eye...")
+                elif reason == 'backoff':
+                    self.log(f"🧊 Cooling off for {format_duration(delay)} after Instagram pushed back...", WARNING)
+                else:
+                    self.log(f"🪣 The {reason} is spent - waiting {format_duration(delay)} for room...", WARNING)
+            self.log(f"⏳ {remaining} to go - about {format_duration(self.pacing.eta(remaining, workers))} left", DEBUG)
+            
+            with TRACER.span('pacing.wait', reason=reason, seconds=round(delay, 2)):
+                stopped = stop_event.wait(delay)
+            if stopped:
+                self.pacing.release(slot)
+                return False
+            # A block seen by another worker while we slept moves the goalposts
+            if not self.pacing.in_backoff():
+                return True
+            self.pacing.release(slot)
+    
+    def _perform_parallel_unfollow(self):
+        """Unfollow users across several browser sessions sharing one rate budget"""
+        self.log(f"🧵 Spinning up {self.unfollow_workers} browser sessions sharing one pace of at most {self.actions_per_minute:g} "
+                 "unfollows/minute (PyAutoGUI fallback is off in parallel mode)")
+        executor = UnfollowExecutor(self, self.users_to_unfollow, self.unfollow_workers, self._cancel_event())
+        results = executor.run()
+        unfollowed_count = sum(1 for status, reason in results.values() if status == 'confirmed' and reason != 'account_gone')
+        return unfollowed_count, not executor.stop_event.is_set()
+    
+    def _page_state(self, driver):
+        """Gone/private/blocked/verified/business flags, follower count label and button labels of the current page"""
+        with TRACER.span('script.profile_state'):
+            return driver.execute_script(PROFILE_STATE_JS, list(ACTION_BLOCK_PHRASES))
+    
+    def _cache_page_state(self, username, state):
+        """Write what a profile visit showed through to the profile cache"""
+        if state['gone']:
+            self.profile_cache.put(username, exists=False)
+            return
+        fields = {'exists': True, 'private': state['private'], 'verified': state['verified'], 'business': state['business']}
+        followers = self._parse_count(state['followers'])
+        if followers is not None:
+            fields['followers'] = followers
+        # Without a recognisable button the follow state stays whatever we knew before
+        labels = state['buttons']
+        if 'Requested' in labels:
+            fields['follow_state'] = 'requested'
+        elif 'Following' in labels:
+            fields['follow_state'] = 'following'
+        elif any(label.startswith('Follow') for label in labels):
+            fields['follow_state'] = 'not_following'
+        self.profile_cache.put(username, **fields)
+    
+    def _unfollow_on_page(self, driver, username):
+        """Open a profile and unfollow through its buttons, returns (status, reason)
+        
+        status is one of 'confirmed', 'gone', 'blocked' or 'failed'.
+        """
+        METRICS.inc('instaunfollower_unfollow_attempts_total', mode='profile')
+        started = time.monotonic()
+        with TRACER.span('unfollow.profile', username=username) as span:
+            status, reason = self._unfollow_profile(driver, username)
+            span.set(status, reason=reason)
+        elapsed = time.monotonic() - started
+        METRICS.inc('instaunfollower_unfollows_total', status=status, reason=reason or 'none')
+        METRICS.observe('instaunfollower_unfollow_seconds', elapsed, mode='profile')
+        self._report_unfollow(username, status, elapsed)
+        return status, reason
+    
+    def _report_unfollow(self, username, status, elapsed):
+        # A blocked account goes back in the queue, so it doesn't count towards the total yet
+        severity = {'confirmed': SUCCESS, 'gone': SUCCESS, 'blocked': ERROR}.get(status, WARNING)
+        self.progress.update(username=username, severity=severity, duration=elapsed, advance=status != 'blocked')
+    
+    def _unfollow_profile(self, driver, username):
+        # A deletion seen in the last few hours doesn't need another page load to confirm
+        cached = self.profile_cache.get(username)
+        if cached and cached['exists'] is False:
+            self.log(f"👻 @{username} was already gone last time we looked - skipping the visit")
+            return 'gone', 'deleted'
+        
+        # Navigate to user profile with error handling
+        try:
+            self._visit(f"{self.base_url}/{username}/", 'profile', driver)
+            self._wait_step('unfollow.profile_ready', document_ready((By.XPATH, "//header | //main//h2")), driver=driver)
+            
+            # One read of the page gives existence, privacy, badges and buttons - cached for later runs
+            state = self._page_state(driver)
+            self._cache_page_state(username, state)
+            if state['gone']:
+                self.log(f"👻 @{username} has vanished from Instagram entirely - account deleted!", WARNING)
+                return 'gone', 'deleted'
+                
+            if state['private']:
+                self.log(f"🔐 @{username} is hiding behind a private wall - but we'll still try!")
+                
+        except Exception as e:
+            self.log(f"🌊 Navigation to @{username} failed - internet hiccup: {str(e)[:30]}...", WARNING)
+            return 'failed', 'navigation'
+        # Cancelled while the page loaded - don't start clicking
+        self._check_cancelled()
+        
+        if state['blocked']:
+            return 'blocked', 'action_block'
+        
+        reason = 'no_button'
+        
+        # Every button strategy is raced in one query instead of a timeout per selector; a glitch gets one retry
+        for attempt in range(2):
+            try:
+                self.log(f"🎯 Attempting unfollow strategy for @{username}...")
+                following_btn, _ = self.selectors.find(driver, 'unfollow.following_button', 3, self.log, clickable=True)
+                if following_btn is None:
+                    break
+                
+                # Scroll to button to ensure it's visible
+                # scrollIntoView is synchronous, so the button is clickable right away
+                driver.execute_script("arguments[0].scrollIntoView(true);", following_btn)
+                
+                # Click the following button
+                following_btn.click()
+                self._wait_step('unfollow.confirm_dialog', EC.presence_of_element_located((By.XPATH, "//div[@role='dialog']")), driver=driver)
+                
+                unfollow_confirm, _ = self.selectors.find(driver, 'unfollow.confirm_button', 2, self.log, clickable=True)
+                if unfollow_confirm is not None:
+                    unfollow_confirm.click()
+                    # Wait for the button to flip (or be replaced) before verifying
+                    self._wait_step('unfollow.verified', EC.any_of(
+                        EC.staleness_of(following_btn),
+                        EC.presence_of_element_located((By.XPATH, "//button[contains(., 'Follow') and not(contains(., 'Following')) and not(contains(., 'Requested'))]"))
+                    ), driver=driver)
+                    state = self._page_state(driver)
+                    if state['blocked']:
+                        self.log(f"🛑 Instagram answered @{username}'s unfollow with an action block!", ERROR)
+                        return 'blocked', 'action_block'
+                    labels = state['buttons']
+                    if any(label.startswith('Follow') and label != 'Following' for label in labels):
+                        # "Follow" button appeared (success indicator)
+                        self.log(f"🎉 @{username} has been successfully yeeted into the digital void!", SUCCESS)
+                        self.profile_cache.put(username, follow_state='not_following')
+                        return 'confirmed', ''
+                    elif any(label in ('Following', 'Requested') for label in labels):
+                        self.log(f"😤 @{username} is still lurking in your following list - Instagram might be protecting them!", WARNING)
+                        reason = 'still_following'
+                    else:
+                        # Following button not found, probably unfollowed
+                        self.log(f"🎊 @{username} vanished successfully (probably unfollowed)!", SUCCESS)
+                        self.profile_cache.put(username, follow_state='not_following')
+                        return 'confirmed', 'probable'
+                else:
+                    self.log(f"🙄 @{username}'s unfollow confirmation button is playing hide and seek!", WARNING)
+                    reason = 'no_confirm'
+                    
+            except Exception as e:
+                self.log(f"🤖 @{username} caused a digital glitch: {str(e)[:50]}...", WARNING)
+                continue
+        
+        return 'failed', reason
+    
+    def cleanup(self):
+        if self.driver:
+            try:
+                # Keep the saved session fresh so the next launch can skip the login form
+                if self.session_store.has(self.username):
+                    self.save_session()
+            except:
+                pass
+            # Back to the pool wiped clean, ready for the next account
+            self.open_pages.pop(id(self.driver), None)
+            DRIVER_POOL.release(self.driver)
+            self.driver = None
@@ -0,0 +1,1143 @@
+#!/usr/bin/env python3
+"""PyQt5 front end for the engine in insta_engine.py"""
+
+import sys
+import argparse
+import time
+import threading
+
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                             QHBoxLayout, QLabel, QLineEdit, QPushButton, 
+                             QTabWidget, QPlainTextEdit, QCheckBox,
+                             QProgressBar, QMessageBox, QStatusBar, QFrame,
+                             QGraphicsDropShadowEffect,
+                             QSpacerItem, QSizePolicy, QGraphicsBlurEffect,
+                             QListView, QFileDialog)
+from PyQt5.QtCore import (Qt, QObject, pyqtSignal, QTimer, pyqtSlot, QPropertyAnimation, QEasingCurve,
+                          QAbstractListModel, QModelIndex)
+from PyQt5.QtGui import (QFont, QColor, QPalette, QBrush, QLinearGradient, QPainter,
+                         QTextCursor, QTextCharFormat)
+
+from insta_engine import (InstagramScraper, LogPipeline, DRIVER_POOL, TRACER, Tracer, METRICS, LOG_COLORS, MAX_LOG_LINES,
+                          INFO, WARNING, format_duration)
+
+# Eighth-block bars for the latency histograms
+HISTOGRAM_BARS = ' ▁▂▃▄▅▆▇█'
+
+
+def format_histogram(summary):
+    """Render Tracer.summary() as a fixed-width table with one sparkline of bucket counts per step"""
+    if not summary:
+        return "No spans recorded yet - enable tracing and run a task."
+    bounds = [f"{bound:g}s" for bound in Tracer.BUCKETS]
+    lines = [f"{'step':<34} {'count':>6} {'mean':>8} {'p50':>8} {'p90':>8} {'max':>8}  histogram ({bounds[0]} … {bounds[-1]}+)"]
+    for name, stats in summary.items():
+        peak = max(stats['buckets']) or 1
+        bars = ''.join(HISTOGRAM_BARS[-1 if count == peak else (count * (len(HISTOGRAM_BARS) - 1) + peak - 1) // peak]
+                       for count in stats['buckets'])
+        outcomes = ', '.join(f"{outcome} {count}" for outcome, count in sorted(stats['outcomes'].items()) if outcome != 'ok')
+        lines.append(f"{name:<34} {stats['count']:>6} {stats['mean']:>7.3f}s {stats['p50']:>7.3f}s {stats['p90']:>7.3f}s "
+                     f"{stats['max']:>7.3f}s  {bars}" + (f"  ({outcomes})" if outcomes else ''))
+    return '\n'.join(lines)
+
+
+class ScraperSignals(QObject):
+    """Qt mirror of the engine's signals - re-emitting here hands results over to the UI thread"""
+
+    login_result = pyqtSignal(bool, str)
+    scraping_complete = pyqtSignal(list)
+    unfollow_complete = pyqtSignal(str)
+    task_started = pyqtSignal(str)
+    progress_event = pyqtSignal(object)
+    task_failed = pyqtSignal(str, str)
+    task_cancelled = pyqtSignal(str)
+    task_finished = pyqtSignal(str)
+
+    def __init__(self, scraper, parent=None):
+        super().__init__(parent)
+        self.scraper = scraper
+        # Kept so detach() can hand the very same callables back to the engine
+        self.forwards = {name: getattr(self, name).emit for name in InstagramScraper.SIGNALS}
+        for name, forward in self.forwards.items():
+            getattr(scraper, name).connect(forward)
+
+    def detach(self):
+        """Stop forwarding, so a worker still winding down never emits into a deleted QObject"""
+        for name, forward in self.forwards.items():
+            getattr(self.scraper, name).disconnect(forward)
+
+
+class ModernButton(QPushButton):
+    def __init__(self, text, primary=False):
+        super().__init__(text)
+        self.setFixedHeight(45)
+        self.setCursor(Qt.PointingHandCursor)
+        
+        if primary:
+            self.setStyleSheet("""
+                QPushButton {
+                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                        stop:0 #6366f1, stop:1 #8b5cf6);
+                    color: #ffffff;
+                    border: none;
+                    border-radius: 12px;
+                    font-weight: 600;
+                    font-size: 15px;
+                    padding: 0 25px;
+                    text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3);
+                }
+                QPushButton:hover {
+                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                        stop:0 #5855eb, stop:1 #7c3aed);
+                }
+                QPushButton:pressed {
+                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                        stop:0 #4338ca, stop:1 #6d28d9);
+                }
+                QPushButton:disabled {
+                    background: #374151;
+                    color: #6b7280;
+                }
+            """)
+        else:
+            self.setStyleSheet("""
+                QPushButton {
+                    background-color: #374151;
+                    color: #e5e7eb;
+                    border: 2px solid #4b5563;
+                    border-radius: 12px;
+                    font-weight: 600;
+                    font-size: 15px;
+                    padding: 0 25px;
+                }
+                QPushButton:hover {
+                    background-color: #4b5563;
+                    border-color: #6b7280;
+                    color: #f3f4f6;
+                }
+                QPushButton:pressed {
+                    background-color: #6b7280;
+                    border-color: #9ca3af;
+                }
+                QPushButton:disabled {
+                    background-color: #1f2937;
+                    color: #4b5563;
+                    border-color: #374151;
+                }
+            """)
+        
+        # Add drop shadow for depth
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(8)
+        shadow.setOffset(0, 2)
+        shadow.setColor(QColor(0, 0, 0, 80))
+        self.setGraphicsEffect(shadow)
+
+
+class NonFollowersModel(QAbstractListModel):
+    """Usernames list model with bitset selection, O(1) select-all and an index-based filter"""
+    selection_changed = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._usernames = []
+        self._notes = {}
+        self._rows = None  # source indices matching the filter, None when unfiltered
+        self._filter = ''
+        # A row is selected when its bit differs from _all_selected, so select-all only flips the flag
+        self._all_selected = False
+        self._bits = bytearray()
+        self._selected_count = 0
+        # Colors come from data roles, item stylesheets would override them
+        self._selected_brush = QBrush(QColor('#6366f1'))
+        self._selected_text = QBrush(QColor('#ffffff'))
+        self._text = QBrush(QColor('#e2e8f0'))
+
+    def set_usernames(self, usernames, notes=None):
+        """Replace the list; notes maps a username to extra text shown after it"""
+        self.beginResetModel()
+        self._usernames = list(usernames)
+        self._notes = notes or {}
+        self._all_selected = False
+        self._bits = bytearray((len(self._usernames) + 7) // 8)
+        self._selected_count = 0
+        self._rows = self._matching(range(len(self._usernames)), self._filter) if self._filter else None
+        self.endResetModel()
+        self.selection_changed.emit(0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows) if self._rows is not None else len(self._usernames)
+
+    def _source_row(self, row):
+        return self._rows[row] if self._rows is not None else row
+
+    def _is_selected(self, source_row):
+        bit = (self._bits[source_row >> 3] >> (source_row & 7)) & 1
+        return bool(bit) != self._all_selected
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        source_row = self._source_row(index.row())
+        if role == Qt.DisplayRole:
+            username = self._usernames[source_row]
+            note = self._notes.get(username)
+            return f"@{username}  ·  {note}" if note else f"@{username}"
+        if role == Qt.BackgroundRole and self._is_selected(source_row):
+            return self._selected_brush
+        if role == Qt.ForegroundRole:
+            return self._selected_text if self._is_selected(source_row) else self._text
+        return None
+
+    def toggle(self, index):
+        """Flip the selection of one visible row"""
+        if not index.isValid():
+            return
+        source_row = self._source_row(index.row())
+        self._selected_count += -1 if self._is_selected(source_row) else 1
+        self._bits[source_row >> 3] ^= 1 << (source_row & 7)
+        self.dataChanged.emit(index, index, [Qt.BackgroundRole, Qt.ForegroundRole])
+        self.selection_changed.emit(self._selected_count)
+
+    def set_all_selected(self, selected):
+        """Select or clear every visible row"""
+        if self._rows is None:
+            # Unfiltered: flip the flag and forget individual toggles, the view only repaints visible rows
+            self._all_selected = selected
+            self._bits = bytearray(len(self._bits))
+            self._selected_count = len(self._usernames) if selected else 0
+        else:
+            for source_row in self._rows:
+                if self._is_selected(source_row) != selected:
+                    self._bits[source_row >> 3] ^= 1 << (source_row & 7)
+                    self._selected_count += 1 if selected else -1
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0), self.index(self.rowCount() - 1), [Qt.BackgroundRole, Qt.ForegroundRole])
+        self.selection_changed.emit(self._selected_count)
+
+    def selected_usernames(self):
+        if self._all_selected and not any(self._bits):
+            return list(self._usernames)
+        return [username for row, username in enumerate(self._usernames) if self._is_selected(row)]
+
+    def selected_count(self):
+        return self._selected_count
+
+    def _matching(self, source_rows, text):
+        return [row for row in source_rows if text in self._usernames[row].lower()]
+
+    def set_filter(self, text):
+        """Show only usernames containing text, narrowing the current matches when the query grows"""
+        text = text.strip().lstrip('@').lower()
+        if text == self._filter:
+            return
+        self.beginResetModel()
+        if not text:
+            self._rows = None
+        elif self._rows is not None and self._filter and self._filter in text:
+            self._rows = self._matching(self._rows, text)
+        else:
+            self._rows = self._matching(range(len(self._usernames)), text)
+        self._filter = text
+        self.endResetModel()
+
+
+class InstagramUnfollowerApp(QMainWindow):
+    def __init__(self, dev_mode=False, unfollow_workers=1, actions_per_minute=6, hourly_budget=60, daily_budget=200,
+                 unfollow_mode='profile', browse_profile='lean', page_load_strategy=None):
+        super().__init__()
+        self.dev_mode = dev_mode
+        self.unfollow_workers = unfollow_workers
+        self.unfollow_mode = unfollow_mode
+        self.browse_profile = browse_profile
+        self.page_load_strategy = page_load_strategy
+        self.actions_per_minute = actions_per_minute
+        self.hourly_budget = hourly_budget
+        self.daily_budget = daily_budget
+        self.scraper = None
+        self.teardowns = []
+        self.unfollow_task = None
+        self.logged_in_username = None
+        self.non_followers = []
+        self.log_pipeline = LogPipeline()
+        self.setup_ui()
+        self.create_new_scraper()
+        DRIVER_POOL.warm(self.scraper._create_driver)
+        
+        # Log lines are pulled from the pipeline in batches instead of one signal per message
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(250)
+        self.log_timer.timeout.connect(self.flush_logs)
+        self.log_timer.start()
+        
+        self.performance_timer = QTimer(self)
+        self.performance_timer.setInterval(1000)
+        self.performance_timer.timeout.connect(self.refresh_performance)
+        self.performance_timer.start()
+        
+    def setup_ui(self):
+        self.setWindowTitle("🎭 Instagram Ghost Detector - Dark Edition")
+        self.setFixedSize(1000, 700)
+        
+        # Dark gradient background
+        self.setStyleSheet("""
+            QMainWindow {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #0f172a, stop:0.5 #1e293b, stop:1 #334155);
+            }
+            QLabel {
+                color: #e2e8f0;
+                font-size: 15px;
+                font-weight: 500;
+                background: transparent;
+            }
+            QLineEdit {
+                padding: 14px 18px;
+                border: 2px solid #475569;
+                border-radius: 12px;
+                background-color: #1e293b;
+                font-size: 15px;
+                color: #e2e8f0;
+                font-weight: 400;
+            }
+            QLineEdit:focus {
+                border-color: #6366f1;
+                background-color: #1e293b;
+                box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.2);
+            }
+            QLineEdit::placeholder {
+                color: #64748b;
+                font-weight: 400;
+            }
+            QTabWidget::pane {
+                border: none;
+                background-color: #1e293b;
+                border-radius: 16px;
+                padding: 5px;
+            }
+            QTabBar::tab {
+                padding: 14px 28px;
+                margin-right: 8px;
+                background-color: #334155;
+                border-radius: 12px;
+                font-weight: 600;
+                font-size: 14px;
+                color: #94a3b8;
+                border: none;
+            }
+            QTabBar::tab:selected {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #6366f1, stop:1 #8b5cf6);
+                color: #ffffff;
+            }
+            QTabBar::tab:hover:!selected {
+                background-color: #475569;
+                color: #e2e8f0;
+            }
+            QStatusBar {
+                background-color: #1e293b;
+                color: #e2e8f0;
+                border-top: 1px solid #475569;
+                font-size: 13px;
+                padding: 5px;
+            }
+        """)
+        
+        # Status bar
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        self.status_bar.showMessage("🎆 Ready to detect digital ghosts!")
+        
+        # Central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        self.main_layout = QVBoxLayout(central_widget)
+        self.main_layout.setSpacing(25)
+        self.main_layout.setContentsMargins(35, 35, 35, 35)
+        
+        self.show_login_screen()
+    
+    def create_new_scraper(self):
+        if self.scraper:
+            # The old worker may be mid-step - stop it in the background instead of freezing the window
+            self.scraper_signals.detach()
+            self.scraper.cancel_all()
+            teardown = threading.Thread(target=self.retire_scraper, args=(self.scraper,), name="scraper-teardown", daemon=True)
+            teardown.start()
+            self.teardowns = [thread for thread in self.teardowns if thread.is_alive()] + [teardown]
+            self.scraper_signals.deleteLater()
+        
+        self.scraper = InstagramScraper(self.dev_mode, self.log_pipeline, self.unfollow_workers, self.actions_per_minute,
+                                        self.hourly_budget, self.daily_budget)
+        self.scraper.unfollow_mode = self.unfollow_mode
+        self.scraper.browse_profile = self.browse_profile
+        self.scraper.page_load_strategy = self.page_load_strategy
+        self.scraper_signals = ScraperSignals(self.scraper, self)
+        self.scraper_signals.login_result.connect(self.handle_login_result)
+        self.scraper_signals.scraping_complete.connect(self.handle_scraping_complete)
+        self.scraper_signals.unfollow_complete.connect(self.handle_unfollow_complete)
+        self.scraper_signals.progress_event.connect(self.handle_progress_event)
+        self.scraper_signals.task_finished.connect(self.handle_task_finished)
+        self.scraper_signals.task_cancelled.connect(self.handle_task_cancelled)
+        self.scraper_signals.task_cancelled.connect(self.handle_task_finished)
+    
+    def retire_scraper(self, scraper):
+        """Runs off the UI thread: wait for the worker to stop, then hand its browser back to the pool"""
+        try:
+            scraper.shutdown()
+            scraper.cleanup()
+        except:
+            pass
+    
+    def show_login_screen(self):
+        # Clear layout safely
+        for i in reversed(range(self.main_layout.count())):
+            item = self.main_layout.itemAt(i)
+            if item and item.widget():
+                item.widget().setParent(None)
+            elif item:
+                self.main_layout.removeItem(item)
+        
+        # Modern title with gradient text effect
+        title = QLabel("🎭 Instagram Ghost Detector")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("""
+            font-size: 42px;
+            font-weight: 800;
+            color: #e2e8f0;
+            margin-bottom: 10px;
+            letter-spacing: -1px;
+        """)
+        self.main_layout.addWidget(title)
+        
+        # Subtitle
+        subtitle = QLabel("Discover who's not following you back")
+        subtitle.setAlignment(Qt.AlignCenter)
+        subtitle.setStyleSheet("""
+            font-size: 18px;
+            font-weight: 400;
+            color: #94a3b8;
+            margin-bottom: 30px;
+        """)
+        self.main_layout.addWidget(subtitle)
+        
+        # Modern login form with card design
+        form_widget = QWidget()
+        form_widget.setFixedWidth(450)
+        form_widget.setStyleSheet("""
+            QWidget {
+                background-color: #1e293b;
+                border: 1px solid #334155;
+                border-radius: 20px;
+                padding: 40px;
+            }
+        """)
+        
+        # Enhanced shadow for card effect
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(40)
+        shadow.setOffset(0, 15)
+        shadow.setColor(QColor(0, 0, 0, 80))
+        form_widget.setGraphicsEffect(shadow)
+        
+        form_layout = QVBoxLayout(form_widget)
+        form_layout.setSpacing(20)
+        
+        # Form title
+        form_title = QLabel("Sign in to Instagram")
+        form_title.setAlignment(Qt.AlignCenter)
+        form_title.setStyleSheet("""
+            font-size: 24px;
+            font-weight: 700;
+            color: #e2e8f0;
+            margin-bottom: 20px;
+        """)
+        form_layout.addWidget(form_title)
+        
+        # Username field
+        username_label = QLabel("Username")
+        username_label.setStyleSheet("""
+            font-weight: 600;
+            font-size: 14px;
+            color: #e2e8f0;
+            margin-bottom: 8px;
+        """)
+        form_layout.addWidget(username_label)
+        
+        self.username_input = QLineEdit()
+        self.username_input.setPlaceholderText("Enter your Instagram username")
+        self.username_input.setFixedHeight(48)
+        form_layout.addWidget(self.username_input)
+        
+        form_layout.addSpacing(10)
+        
+        # Password field
+        password_label = QLabel("Password")
+        password_label.setStyleSheet("""
+            font-weight: 600;
+            font-size: 14px;
+            color: #e2e8f0;
+            margin-bottom: 8px;
+        """)
+        form_layout.addWidget(password_label)
+        
+        self.password_input = QLineEdit()
+        self.password_input.setEchoMode(QLineEdit.Password)
+        self.password_input.setPlaceholderText("Enter your Instagram password")
+        self.password_input.setFixedHeight(48)
+        form_layout.addWidget(self.password_input)
+        
+        form_layout.addSpacing(25)
+        
+        # Login button
+        self.login_button = ModernButton("Sign In", primary=True)
+        self.login_button.setFixedHeight(50)
+        self.login_button.clicked.connect(self.login)
+        form_layout.addWidget(self.login_button)
+        
+        # Security note
+        security_note = QLabel("🔒 Your password is never stored - only a session you can end with Sign Out")
+        security_note.setAlignment(Qt.AlignCenter)
+        security_note.setStyleSheet("""
+            font-size: 12px;
+            color: #64748b;
+            margin-top: 15px;
+        """)
+        form_layout.addWidget(security_note)
+        
+        # Center form
+        form_container = QHBoxLayout()
+        form_container.addStretch()
+        form_container.addWidget(form_widget)
+        form_container.addStretch()
+        
+        self.main_layout.addStretch()
+        self.main_layout.addLayout(form_container)
+        self.main_layout.addStretch()
+        
+        # Modern progress bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setFixedHeight(6)
+        self.progress_bar.setStyleSheet("""
+            QProgressBar {
+                border: none;
+                border-radius: 3px;
+                background-color: #475569;
+            }
+            QProgressBar::chunk {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #6366f1, stop:1 #8b5cf6);
+                border-radius: 3px;
+            }
+        """)
+        self.main_layout.addWidget(self.progress_bar)
+    
+    def show_main_screen(self, auto_refresh=True):
+        # Clear layout safely
+        for i in reversed(range(self.main_layout.count())):
+            item = self.main_layout.itemAt(i)
+            if item and item.widget():
+                item.widget().setParent(None)
+            elif item:
+                self.main_layout.removeItem(item)
+        
+        # Header with user info
+        header_layout = QHBoxLayout()
+        
+        welcome_label = QLabel(f"👋 Welcome, @{self.logged_in_username}")
+        welcome_label.setStyleSheet("""
+            font-size: 24px;
+            font-weight: 700;
+            color: #e2e8f0;
+        """)
+        header_layout.addWidget(welcome_label)
+        header_layout.addStretch()
+        
+        logout_btn = ModernButton("Sign Out")
+        logout_btn.setFixedWidth(120)
+        logout_btn.clicked.connect(self.logout)
+        header_layout.addWidget(logout_btn)
+        
+        self.main_layout.addLayout(header_layout)
+        self.main_layout.addSpacing(20)
+        
+        # Tab widget with modern styling
+        self.tab_widget = QTabWidget()
+        
+        # Add shadow to tab widget
+        tab_shadow = QGraphicsDropShadowEffect()
+        tab_shadow.setBlurRadius(20)
+        tab_shadow.setOffset(0, 8)
+        tab_shadow.setColor(QColor(0, 0, 0, 60))
+        self.tab_widget.setGraphicsEffect(tab_shadow)
+        
+        self.main_layout.addWidget(self.tab_widget)
+        
+        # Non-followers tab
+        self.create_non_followers_tab()
+        
+        # Logs tab
+        self.create_logs_tab()
+        
+        # Performance tab
+        self.create_performance_tab()
+        
+        # Bottom controls
+        controls = QHBoxLayout()
+        controls.setSpacing(15)
+        
+        refresh_btn = ModernButton("🔄 Refresh Data", primary=True)
+        refresh_btn.setFixedWidth(160)
+        refresh_btn.clicked.connect(self.refresh_data)
+        controls.addWidget(refresh_btn)
+        
+        controls.addStretch()
+        
+        self.main_layout.addSpacing(20)
+        self.main_layout.addLayout(controls)
+        
+        # Start scraping
+        if auto_refresh:
+            QTimer.singleShot(1000, self.refresh_data)
+    
+    def create_non_followers_tab(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(25, 25, 25, 25)
+        
+        # Header section
+        header = QLabel("People who don't follow you back")
+        header.setStyleSheet("""
+            font-size: 20px;
+            font-weight: 700;
+            color: #e2e8f0;
+            margin-bottom: 10px;
+        """)
+        layout.addWidget(header)
+        
+        # Stats info
+        self.stats_label = QLabel("Loading your followers data...")
+        self.stats_label.setStyleSheet("""
+            font-size: 14px;
+            color: #94a3b8;
+            margin-bottom: 20px;
+        """)
+        layout.addWidget(self.stats_label)
+        
+        # Select all checkbox with modern styling
+        self.select_all_checkbox = QCheckBox("Select All")
+        self.select_all_checkbox.stateChanged.connect(self.toggle_select_all)
+        self.select_all_checkbox.setStyleSheet("""
+            QCheckBox {
+                font-weight: 600;
+                font-size: 15px;
+                color: #e2e8f0;
+                padding: 10px 0;
+            }
+            QCheckBox::indicator {
+                width: 22px;
+                height: 22px;
+                border-radius: 6px;
+                border: 2px solid #64748b;
+                background-color: #1e293b;
+            }
+            QCheckBox::indicator:checked {
+                background-color: #6366f1;
+                border-color: #6366f1;
+                image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDNMNC41IDguNUwyIDYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPg==);
+            }
+            QCheckBox::indicator:hover {
+                border-color: #8b5cf6;
+                background-color: #334155;
+            }
+        """)
+        
+        # Search box, filtering is debounced so typing stays smooth on huge lists
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔍 Search usernames...")
+        self.search_input.setFixedHeight(44)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(lambda: self.non_followers_model.set_filter(self.search_input.text()))
+        self.search_input.textChanged.connect(self.filter_timer.start)
+        
+        select_row = QHBoxLayout()
+        select_row.addWidget(self.select_all_checkbox)
+        select_row.addSpacing(15)
+        select_row.addWidget(self.search_input)
+        layout.addLayout(select_row)
+        
+        # Model-backed list view - only visible rows are ever rendered
+        self.non_followers_model = NonFollowersModel(self)
+        self.non_followers_model.selection_changed.connect(self.update_selection_count)
+        self.non_followers_list = QListView()
+        self.non_followers_list.setModel(self.non_followers_model)
+        self.non_followers_list.setUniformItemSizes(True)
+        self.non_followers_list.setSelectionMode(QListView.NoSelection)
+        self.non_followers_list.clicked.connect(self.non_followers_model.toggle)
+        self.non_followers_list.setStyleSheet("""
+            QListView {
+                border: 1px solid #475569;
+                border-radius: 12px;
+                padding: 10px;
+                background-color: #1e293b;
+                outline: none;
+            }
+            QListView::item {
+                padding: 14px 18px;
+                border-bottom: 1px solid #334155;
+                border-radius: 8px;
+                margin: 3px 5px;
+                font-size: 15px;
+                font-weight: 500;
+            }
+            QListView::item:hover {
+                background-color: #334155;
+            }
+        """)
+        layout.addWidget(self.non_followers_list)
+        
+        # Driven by the scraper's progress events, only shown while a task reports any
+        self.task_progress_bar = QProgressBar()
+        self.task_progress_bar.setFixedHeight(6)
+        self.task_progress_bar.setTextVisible(False)
+        self.task_progress_bar.setVisible(False)
+        self.task_progress_bar.setStyleSheet("""
+            QProgressBar {
+                border: none;
+                border-radius: 3px;
+                background-color: #475569;
+            }
+            QProgressBar::chunk {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #6366f1, stop:1 #8b5cf6);
+                border-radius: 3px;
+            }
+        """)
+        self.task_progress_label = QLabel()
+        self.task_progress_label.setVisible(False)
+        self.task_progress_label.setStyleSheet("font-size: 13px; color: #94a3b8;")
+        layout.addSpacing(10)
+        layout.addWidget(self.task_progress_bar)
+        layout.addWidget(self.task_progress_label)
+        
+        # Action buttons
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(15)
+        
+        self.unfollow_button = ModernButton("Unfollow Selected", primary=True)
+        self.unfollow_button.clicked.connect(self.unfollow_selected)
+        self.unfollow_button.setEnabled(False)
+        button_layout.addWidget(self.unfollow_button)
+        
+        # Only shown while an unfollow run is going
+        self.cancel_button = ModernButton("Cancel")
+        self.cancel_button.setFixedWidth(120)
+        self.cancel_button.clicked.connect(self.cancel_unfollow)
+        self.cancel_button.setVisible(False)
+        button_layout.addWidget(self.cancel_button)
+        
+        button_layout.addStretch()
+        
+        layout.addSpacing(20)
+        layout.addLayout(button_layout)
+        
+        self.tab_widget.addTab(widget, "👥 Non-Followers")
+    
+    def create_logs_tab(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(25, 25, 25, 25)
+        
+        # Logs header
+        logs_header = QLabel("Activity Logs")
+        logs_header.setStyleSheet("""
+            font-size: 20px;
+            font-weight: 700;
+            color: #e2e8f0;
+            margin-bottom: 20px;
+        """)
+        layout.addWidget(logs_header)
+        
+        # Bounded logs view - the full log lives in logs/instaunfollower.log
+        self.logs_text = QPlainTextEdit()
+        self.logs_text.setReadOnly(True)
+        self.logs_text.setMaximumBlockCount(MAX_LOG_LINES)
+        self.logs_text.setStyleSheet("""
+            QPlainTextEdit {
+                border: 1px solid #475569;
+                border-radius: 12px;
+                background-color: #0f172a;
+                color: #e2e8f0;
+                padding: 20px;
+                font-family: 'SF Mono', 'Monaco', 'Consolas', monospace;
+                font-size: 13px;
+                line-height: 1.6;
+            }
+            QPlainTextEdit:focus {
+                border-color: #6366f1;
+            }
+        """)
+        layout.addWidget(self.logs_text)
+        
+        # Clear logs button
+        clear_btn = ModernButton("Clear Logs")
+        clear_btn.setFixedWidth(120)
+        clear_btn.clicked.connect(self.logs_text.clear)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(clear_btn)
+        
+        layout.addSpacing(15)
+        layout.addLayout(button_layout)
+        
+        self.tab_widget.addTab(widget, "📜 Logs")
+    
+    def create_performance_tab(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(25, 25, 25, 25)
+        
+        performance_header = QLabel("Step Latency")
+        performance_header.setStyleSheet("""
+            font-size: 20px;
+            font-weight: 700;
+            color: #e2e8f0;
+            margin-bottom: 20px;
+        """)
+        layout.addWidget(performance_header)
+        
+        self.trace_checkbox = QCheckBox("Record traces")
+        self.trace_checkbox.setChecked(TRACER.enabled)
+        self.trace_checkbox.setStyleSheet("font-weight: 600; font-size: 15px; color: #e2e8f0; padding: 10px 0;")
+        self.trace_checkbox.stateChanged.connect(lambda state: setattr(TRACER, 'enabled', state == Qt.Checked))
+        layout.addWidget(self.trace_checkbox)
+        
+        self.performance_text = QPlainTextEdit()
+        self.performance_text.setReadOnly(True)
+        self.performance_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.performance_text.setStyleSheet("""
+            QPlainTextEdit {
+                border: 1px solid #475569;
+                border-radius: 12px;
+                background-color: #0f172a;
+                color: #e2e8f0;
+                padding: 20px;
+                font-family: 'SF Mono', 'Monaco', 'Consolas', monospace;
+                font-size: 13px;
+            }
+        """)
+        layout.addWidget(self.performance_text)
+        
+        export_btn = ModernButton("Export Trace")
+        export_btn.setFixedWidth(140)
+        export_btn.clicked.connect(self.export_trace)
+        reset_btn = ModernButton("Reset")
+        reset_btn.setFixedWidth(120)
+        reset_btn.clicked.connect(lambda: (TRACER.reset(), self.refresh_performance()))
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(export_btn)
+        button_layout.addWidget(reset_btn)
+        
+        layout.addSpacing(15)
+        layout.addLayout(button_layout)
+        
+        self.performance_index = self.tab_widget.addTab(widget, "⏱️ Performance")
+        self.tab_widget.currentChanged.connect(lambda index: self.refresh_performance())
+    
+    def refresh_performance(self):
+        # Only redrawn while someone is looking at it
+        if not hasattr(self, 'performance_text') or not self.tab_widget.isVisible() \
+                or self.tab_widget.currentIndex() != self.performance_index:
+            return
+        text = format_histogram(TRACER.summary())
+        if text != self.performance_text.toPlainText():
+            self.performance_text.setPlainText(text)
+    
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Chrome Trace", "instaunfollower-trace.json", "Trace JSON (*.json)")
+        if not path:
+            return
+        try:
+            count = TRACER.export_chrome_trace(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Export Failed", f"Couldn't write the trace: {e}")
+            return
+        self.status_bar.showMessage(f"⏱️ Exported {count} spans - open them in chrome://tracing or ui.perfetto.dev")
+    
+    def login(self):
+        username = self.username_input.text().strip()
+        password = self.password_input.text().strip()
+        
+        # A saved session lets us log in without the password
+        if not username or (not password and not self.scraper.session_store.has(username)):
+            QMessageBox.warning(self, "Missing Credentials", 
+                               "Please enter both your Instagram username and password.")
+            return
+        
+        self.login_button.setEnabled(False)
+        self.login_button.setText("Signing in...")
+        self.progress_bar.setVisible(True)
+        
+        self.logged_in_username = username
+        self.scraper.login(username, password)
+    
+    def refresh_data(self):
+        if not self.logged_in_username:
+            return
+        
+        self.stats_label.setText("Refreshing data...")
+        self.scraper.scrape_data()
+    
+    def logout(self):
+        self.scraper.forget_session()
+        self.logged_in_username = None
+        self.unfollow_task = None
+        self.create_new_scraper()
+        self.show_login_screen()
+    
+    def flush_logs(self):
+        records = self.log_pipeline.drain()
+        if not records:
+            return
+        
+        if hasattr(self, 'logs_text'):
+            # Anything beyond the view's capacity would be trimmed straight away, so don't insert it
+            records_to_show = records[-MAX_LOG_LINES:]
+            scrollbar = self.logs_text.verticalScrollBar()
+            at_bottom = scrollbar.value() == scrollbar.maximum()
+            
+            cursor = QTextCursor(self.logs_text.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.beginEditBlock()
+            for created, level, message in records_to_show:
+                if not self.logs_text.document().isEmpty():
+                    cursor.insertBlock()
+                text_format = QTextCharFormat()
+                text_format.setForeground(QColor(LOG_COLORS.get(level, LOG_COLORS[INFO])))
+                cursor.insertText(f"[{time.strftime('%H:%M:%S', time.localtime(created))}] {message}", text_format)
+            cursor.endEditBlock()
+            
+            if at_bottom:
+                scrollbar.setValue(scrollbar.maximum())
+        
+        self.status_bar.showMessage(records[-1][2])
+    
+    @pyqtSlot(bool, str)
+    def handle_login_result(self, success, message):
+        self.login_button.setEnabled(True)
+        self.login_button.setText("Sign In")
+        self.progress_bar.setVisible(False)
+        
+        if success:
+            job = self.scraper.pending_unfollow_job()
+            resume = False
+            if job:
+                reply = QMessageBox.question(
+                    self, "Resume Unfollow Job",
+                    f"An earlier unfollow job was interrupted with {len(job['remaining'])} of "
+                    f"{len(job['users'])} account(s) not confirmed.\n\nResume it now?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.Yes
+                )
+                resume = reply == QMessageBox.Yes
+            
+            # The unfollow run refreshes the data itself once it's done
+            self.show_main_screen(auto_refresh=not resume)
+            if resume:
+                self.start_unfollow(job['remaining'], resume=True)
+        else:
+            QMessageBox.critical(self, "Login Failed", 
+                                f"Unable to login to Instagram:\n\n{message}")
+    
+    @pyqtSlot(list)
+    def handle_scraping_complete(self, non_followers):
+        self.non_followers = non_followers
+        self.select_all_checkbox.blockSignals(True)
+        self.select_all_checkbox.setChecked(False)
+        self.select_all_checkbox.blockSignals(False)
+        # Longest-followed first when there's snapshot history to rank by
+        analysis = self.scraper.analysis if self.scraper else None
+        notes = {}
+        if analysis:
+            notes = {username: f"followed {days}+ days" for username, days in analysis['followed_days'].items() if days}
+        self.non_followers_model.set_usernames(non_followers, notes)
+        
+        self.unfollow_button.setEnabled(len(non_followers) > 0)
+        
+        # Update stats
+        stats = f"Found {len(non_followers)} accounts that don't follow you back"
+        if analysis:
+            stats += (f" · {analysis['mutuals']} mutuals · {len(analysis['stale'])} stale"
+                      f" · {len(analysis['lost_followers'])} lost followers")
+        self.stats_label.setText(stats)
+        self.status_bar.showMessage(f"✅ Data refreshed - Found {len(non_followers)} non-followers")
+    
+    def toggle_select_all(self, state):
+        self.non_followers_model.set_all_selected(state == Qt.Checked)
+    
+    @pyqtSlot(int)
+    def update_selection_count(self, count):
+        if self.unfollow_task:
+            return
+        self.unfollow_button.setText(f"Unfollow Selected ({count})" if count else "Unfollow Selected")
+    
+    def unfollow_selected(self):
+        selected_usernames = self.non_followers_model.selected_usernames()
+        
+        if not selected_usernames:
+            QMessageBox.warning(self, "No Selection", 
+                               "Please select at least one account to unfollow.")
+            return
+        
+        # Modern confirmation dialog
+        reply = QMessageBox.question(
+            self, "Confirm Unfollow", 
+            f"Are you sure you want to unfollow {len(selected_usernames)} account(s)?\n\n"
+            "This action cannot be undone.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            self.start_unfollow(selected_usernames)
+    
+    def start_unfollow(self, usernames, resume=False):
+        self.unfollow_button.setEnabled(False)
+        self.unfollow_button.setText("Unfollowing...")
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setText("Cancel")
+        self.cancel_button.setVisible(True)
+        self.unfollow_task = self.scraper.unfollow_users(usernames, resume=resume)
+    
+    def cancel_unfollow(self):
+        if self.unfollow_task:
+            self.unfollow_task.cancel()
+            self.cancel_button.setEnabled(False)
+            self.cancel_button.setText("Cancelling...")
+    
+    @pyqtSlot(object)
+    def handle_progress_event(self, event):
+        if not hasattr(self, 'task_progress_bar'):
+            return
+        if event.total:
+            self.task_progress_bar.setRange(0, event.total)
+            self.task_progress_bar.setValue(min(event.index, event.total))
+        else:
+            self.task_progress_bar.setRange(0, 0)
+        
+        if event.kind == 'unfollow':
+            text = f"Unfollowing {event.index}/{event.total}"
+            if event.rate:
+                text += f" · {event.rate * 60:.1f}/min"
+        else:
+            text = f"Scanning {event.stage} {event.index}/{event.total or '?'}"
+            if event.rate:
+                text += f" · {event.rate:.0f} rows/s"
+        if event.eta is not None:
+            text += f" · about {format_duration(event.eta)} left"
+        if event.username:
+            text += f" · last: @{event.username}"
+        color = LOG_COLORS.get(event.severity, LOG_COLORS[INFO]) if event.severity >= WARNING else '#94a3b8'
+        self.task_progress_label.setStyleSheet(f"font-size: 13px; color: {color};")
+        self.task_progress_label.setText(text)
+        self.task_progress_bar.setVisible(True)
+        self.task_progress_label.setVisible(True)
+        
+        if event.kind == 'unfollow' and self.unfollow_task:
+            self.unfollow_button.setText(f"Unfollowing... {event.index}/{event.total}")
+    
+    @pyqtSlot(str)
+    def handle_task_finished(self, kind):
+        if hasattr(self, 'task_progress_bar'):
+            self.task_progress_bar.setVisible(False)
+            self.task_progress_label.setVisible(False)
+    
+    @pyqtSlot(str)
+    def handle_task_cancelled(self, kind):
+        if kind == 'scrape' and hasattr(self, 'stats_label'):
+            self.stats_label.setText("Refresh cancelled")
+    
+    @pyqtSlot(str)
+    def handle_unfollow_complete(self, message):
+        self.unfollow_task = None
+        self.cancel_button.setVisible(False)
+        self.unfollow_button.setEnabled(True)
+        self.unfollow_button.setText("Unfollow Selected")
+        
+        QMessageBox.information(self, "Unfollow Complete", message)
+        
+        # Refresh data to update the list
+        QTimer.singleShot(2000, self.refresh_data)
+    
+    def closeEvent(self, event):
+        if self.scraper:
+            self.scraper.shutdown()
+            self.scraper.cleanup()
+        for teardown in self.teardowns:
+            teardown.join(15)
+        DRIVER_POOL.shutdown()
+        METRICS.close()
+        self.flush_logs()
+        self.log_pipeline.close()
+        event.accept()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Instagram Ghost Detector - Find who doesn\'t follow you back')
+    parser.add_argument('--dev', action='store_true', help='Show browser window for debugging')
+    parser.add_argument('--workers', type=int, default=1, help='Browser sessions to unfollow with in parallel')
+    parser.add_argument('--actions-per-minute', type=float, default=6, help='Fastest unfollow pace, shared by all sessions')
+    parser.add_argument('--per-hour', type=int, default=60, help='Unfollows allowed in any rolling hour')
+    parser.add_argument('--per-day', type=int, default=200, help='Unfollows allowed in any rolling 24 hours')
+    parser.add_argument('--unfollow-mode', choices=('profile', 'dialog'), default='profile',
+                        help='Unfollow on each profile page, or in place from the rows of the following list')
+    parser.add_argument('--browse-profile', choices=('lean', 'full'), default='lean',
+                        help='lean skips images, video and fonts and doesn\'t wait for them; full loads pages like normal Chrome')
+    parser.add_argument('--page-load-strategy', choices=('normal', 'eager', 'none'),
+                        help='Override how long page loads block (default: eager for lean, normal for full)')
+    parser.add_argument('--trace', action='store_true', help='Record step timings from the start (also switchable in the Performance tab)')
+    parser.add_argument('--metrics-port', type=int, help='Serve Prometheus metrics on http://127.0.0.1:PORT/metrics')
+    parser.add_argument('--metrics-file', help='Also dump the metrics to this file (node_exporter textfile format)')
+    parser.add_argument('--metrics-interval', type=float, default=15, help='Seconds between metrics file dumps')
+    parser.add_argument('--pool-size', type=int, default=1, help='Warm browsers kept alive between tasks and accounts')
+    parser.add_argument('--recycle-after', type=int, default=50, help='Tasks a browser runs before it is replaced')
+    parser.add_argument('--max-browser-mb', type=int, default=1500, help='Replace a browser once it uses more memory than this (needs psutil)')
+    args = parser.parse_args()
+    
+    TRACER.enabled = args.trace
+    if args.metrics_port is not None:
+        METRICS.serve(args.metrics_port)
+    if args.metrics_file:
+        METRICS.dump_every(args.metrics_file, args.metrics_interval)
+    DRIVER_POOL.size = max(0, args.pool_size)
+    DRIVER_POOL.max_tasks = max(1, args.recycle_after)
+    DRIVER_POOL.max_memory_mb = args.max_browser_mb
+    
+    app = QApplication(sys.argv)
+    app.setStyle('Fusion')
+    
+    # Set application font
+    font = QFont("Segoe UI", 10)
+    app.setFont(font)
+    
+    window = InstagramUnfollowerApp(dev_mode=args.dev, unfollow_workers=max(1, args.workers),
+                                    actions_per_minute=args.actions_per_minute,
+                                    hourly_budget=max(1, args.per_hour), daily_budget=max(1, args.per_day),
+                                    unfollow_mode=args.unfollow_mode, browse_profile=args.browse_profile,
+                                    page_load_strategy=args.page_load_strategy)
+    window.show()
+    
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()